@@ -6,6 +6,7 @@ Creates high-fidelity browser contexts with pre-authenticated state.
 Supports transparent decryption of encrypted auth files.
 """
 
+import asyncio
 from pathlib import Path
 from playwright.async_api import async_playwright, Browser, BrowserContext
 from config import Config
@@ -23,6 +24,8 @@ class SessionManager:
         self.headless = headless if headless is not None else Config.HEADLESS
         # Store user-specific auth file path
         self.auth_file = auth_file
+        # Guards lazy creation of the shared (warm) context
+        self._context_lock = asyncio.Lock()
 
     async def initialize(self) -> BrowserContext:
         """
@@ -90,6 +93,21 @@ class SessionManager:
 
         return self.context
 
+    async def get_or_create_context(self) -> BrowserContext:
+        """
+        Return the warm browser context, launching the browser on first use.
+
+        Lets callers that book repeatedly reuse one context (and just open a
+        new page each time) instead of paying the Chromium launch every time.
+
+        Returns:
+            BrowserContext: Authenticated browser context
+        """
+        async with self._context_lock:
+            if self.context is None:
+                await self.initialize()
+            return self.context
+
     async def close(self):
         """Clean up browser resources"""
         if self.context:
@@ -99,6 +117,11 @@ class SessionManager:
         if self.playwright:
             await self.playwright.stop()
 
+        # Allow get_or_create_context() to start a fresh session afterwards
+        self.context = None
+        self.browser = None
+        self.playwright = None
+
         print("[INFO] Browser session closed")
 
     async def __aenter__(self):
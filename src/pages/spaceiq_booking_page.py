@@ -6,7 +6,7 @@ This implements the actual booking flow for your SpaceIQ system.
 """
 
 from .base_page import BasePage
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timedelta
 import asyncio
@@ -275,6 +275,69 @@ class SpaceIQBookingPage(BasePage):
         # Verbose output suppressed - using pretty output in workflow
         # print("       Floor map loaded with availability circles")
 
+    async def count_map_elements(self):
+        """
+        Count the SVG elements currently on the floor map.
+
+        Taken before clicking Update so wait_for_map_to_render() can tell the
+        new date's map apart from the one already on screen.
+
+        Returns:
+            int: Number of SVG elements, or None if the page could not be read
+        """
+        try:
+            return await self.page.evaluate("() => document.querySelectorAll('svg *').length")
+        except Exception:
+            return None
+
+    async def wait_for_map_to_render(self, baseline_count=None, timeout_ms: int = 7000, settle_ms: int = 500):
+        """
+        Wait until the floor map SVG has been redrawn for the new date.
+
+        Polls the number of SVG elements and returns once it differs from
+        baseline_count (the count before Update was clicked) and has stayed the
+        same for settle_ms. If that never happens - same element count, no
+        baseline, or the page can't be read - it falls back to the old fixed
+        wait of timeout_ms.
+
+        Args:
+            baseline_count: Element count from count_map_elements() before Update
+            timeout_ms: Maximum time to wait, same as the old fixed wait
+            settle_ms: How long the element count must stay the same
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        if baseline_count is not None:
+            try:
+                await self.page.wait_for_function(
+                    """([token, baseline, settleMs]) => {
+                        const count = document.querySelectorAll('svg *').length;
+                        const now = performance.now();
+                        let state = window.__mapRenderState;
+                        if (!state || state.token !== token) {
+                            state = window.__mapRenderState = {token, count: -1, since: now};
+                        }
+                        if (count !== state.count) {
+                            state.count = count;
+                            state.since = now;
+                            return false;
+                        }
+                        return count > 0 && count !== baseline && now - state.since >= settleMs;
+                    }""",
+                    arg=[datetime.now().timestamp(), baseline_count, settle_ms],
+                    polling=100,
+                    timeout=timeout_ms
+                )
+                return
+            except PlaywrightTimeoutError:
+                return  # Already waited the full fixed wait
+            except Exception:
+                pass  # Page couldn't be polled - fall back to the fixed wait
+
+        remaining = timeout_ms / 1000 - (loop.time() - started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
     async def get_available_desks_from_sidebar(self, desk_prefix: str, logger=None) -> list:
         """
         Parse sidebar to find available desks.
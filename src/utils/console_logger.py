@@ -6,18 +6,30 @@ ANSI escape codes are stripped from file output to reduce log size.
 File size is limited to prevent multi-GB logs during long runs.
 """
 
+import atexit
 import sys
 import re
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
 
 
+# Sentinel pushed onto the queue to stop the background writer
+_STOP = object()
+
+
 class ConsoleLogger:
     """
     Tee-style logger that writes to both console and file.
     Captures all print() statements automatically.
     ANSI escape codes are stripped from file output.
     Implements circular buffer to limit file size.
+
+    Terminal output is written synchronously (preserves ordering), while
+    ANSI stripping, filtering and file writes run on a background thread.
+    flush() waits for queued output to reach the file, and close() runs at
+    interpreter exit so the log is complete even without an explicit stop.
     """
 
     # Regex to match ANSI escape sequences
@@ -33,11 +45,47 @@ class ConsoleLogger:
         self.last_message = ""  # Track last message to filter duplicates
         self.duplicate_count = 0
 
+        # Background writer: callers only pay for a queue put
+        self._q = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._drain, name="ConsoleLoggerWriter", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
     def write(self, message):
-        """Write to both terminal and file (file gets cleaned version)"""
+        """Write to terminal immediately and queue the message for the log file"""
         # Always write to terminal as-is (preserves colors)
         self.terminal.write(message)
+        self._q.put_nowait(message)
+
+    def _drain(self):
+        """Background loop: process queued messages, flush when the queue is idle"""
+        while True:
+            message = self._q.get()
+            if message is _STOP:
+                break
+            if isinstance(message, threading.Event):
+                # flush() request: everything queued before it has been written
+                try:
+                    self.file.flush()
+                except Exception:
+                    pass
+                message.set()
+                continue
+            try:
+                self._write_to_file(message)
+                # Batch flushes: only flush once the queue has been drained
+                if self._q.empty():
+                    self.file.flush()
+            except Exception:
+                # Never let a logging failure kill the writer thread
+                pass
+        try:
+            self.file.flush()
+        except Exception:
+            pass
 
+    def _write_to_file(self, message):
+        """Strip, filter and write a single message to the log file (writer thread only)"""
         # Strip ANSI codes from file output to reduce size
         if self.strip_ansi:
             clean_message = self.ANSI_ESCAPE_PATTERN.sub('', message)
@@ -51,7 +99,6 @@ class ConsoleLogger:
         ]):
             # Skip these lines entirely, but preserve existing booking messages
             if 'existing booking found' not in clean_message.lower():
-                self.file.flush()
                 return
 
         # Filter out duplicate and useless messages to reduce log spam
@@ -67,8 +114,7 @@ class ConsoleLogger:
             if self.duplicate_count % 20 == 0:
                 self.file.write(clean_message)
             else:
-                # Don't write to file but still flush terminal
-                self.file.flush()
+                # Don't write to file
                 return
         elif self._is_useless_message(message_stripped):
             # Skip useless messages entirely
@@ -84,9 +130,6 @@ class ConsoleLogger:
         if self.check_counter >= 100:
             self.check_counter = 0
             self._check_and_rotate_if_needed()
-        else:
-            # Still flush regularly for real-time logging
-            self.file.flush()
 
     def _is_useless_message(self, message: str) -> bool:
         """Check if a message is useless and should be filtered out"""
@@ -175,12 +218,19 @@ class ConsoleLogger:
             pass
 
     def flush(self):
-        """Flush both streams"""
+        """Flush the terminal, then wait until queued messages are flushed to the file"""
         self.terminal.flush()
-        self.file.flush()
+        if self._worker.is_alive():
+            done = threading.Event()
+            self._q.put_nowait(done)
+            done.wait(timeout=2)
 
     def close(self):
-        """Close the file handle"""
+        """Stop the writer thread, draining pending messages, then close the file"""
+        atexit.unregister(self.close)
+        if self._worker.is_alive():
+            self._q.put_nowait(_STOP)
+            self._worker.join(timeout=2)
         self.file.close()
 
 
@@ -5,6 +5,7 @@ Handles desk preference sorting based on configured priority ranges.
 """
 
 from typing import List, Dict, Any
+import functools
 import re
 
 
@@ -94,6 +95,22 @@ def get_desk_priority(desk_code: str, priority_config: List[Dict[str, Any]]) ->
     return 999  # Desk not in any priority range
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_ranges(ranges: tuple) -> tuple:
+    """
+    Parse (range_str, priority) pairs once into (start_num, end_num, priority).
+
+    Cached, so repeated sorts with the same config skip the string parsing.
+    """
+    compiled = []
+    for range_str, priority in ranges:
+        start_desk, end_desk = parse_range(range_str)
+        if not start_desk or not end_desk:
+            continue
+        compiled.append((parse_desk_number(start_desk), parse_desk_number(end_desk), priority))
+    return tuple(compiled)
+
+
 def sort_desks_by_priority(
     desks: List[str],
     priority_config: List[Dict[str, Any]]
@@ -120,12 +137,19 @@ def sort_desks_by_priority(
     if not priority_config:
         return desks  # No sorting needed
 
+    ranges = _compile_ranges(tuple(
+        (config.get("range", ""), config.get("priority", 999))
+        for config in priority_config
+    ))
+
     # Sort by priority (lower priority number = higher preference)
     # Then by desk number for consistency within same priority
     def priority_key(desk_code: str):
-        priority = get_desk_priority(desk_code, priority_config)
         desk_num = parse_desk_number(desk_code)
-        return (priority, desk_num)
+        for start_num, end_num, priority in ranges:
+            if start_num <= desk_num <= end_num:
+                return (priority, desk_num)
+        return (999, desk_num)
 
     return sorted(desks, key=priority_key)
 
@@ -4,19 +4,25 @@ Logs all actions to a timestamped file with size rotation
 """
 
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from datetime import datetime
 from pathlib import Path
 
 
-def setup_file_logger(name: str = "spaceiq_bot", max_bytes: int = 50 * 1024 * 1024, backup_count: int = 3):
+def setup_file_logger(name: str = "spaceiq_bot", max_bytes: int = 50 * 1024 * 1024, backup_count: int = 3,
+                      buffer_capacity: int = 512):
     """
     Set up a logger that writes to file with automatic size rotation.
 
+    Records are buffered in memory and written in batches: when buffer_capacity
+    records have queued up, when an ERROR is logged, on flush_file_logger(),
+    and at interpreter exit.
+
     Args:
         name: Logger name
         max_bytes: Maximum log file size before rotation (default: 50MB)
         backup_count: Number of backup files to keep (default: 3)
+        buffer_capacity: Records to buffer before writing (0 = write every record)
 
     Returns:
         Tuple of (logger instance, log file path)
@@ -29,6 +35,7 @@ def setup_file_logger(name: str = "spaceiq_bot", max_bytes: int = 50 * 1024 * 10
     if logger.handlers:
         # Return existing handler's file path
         for handler in logger.handlers:
+            handler = getattr(handler, 'target', handler)  # Unwrap MemoryHandler
             if isinstance(handler, (logging.FileHandler, RotatingFileHandler)):
                 return logger, Path(handler.baseFilename)
         return logger, None
@@ -60,9 +67,19 @@ def setup_file_logger(name: str = "spaceiq_bot", max_bytes: int = 50 * 1024 * 10
     # NO console handler - all user-facing output goes through pretty_output module
     # Logger writes ONLY to file for debugging
 
-    logger.addHandler(file_handler)
+    if buffer_capacity > 0:
+        # Batch writes; errors flush immediately so the context around them is on disk
+        logger.addHandler(MemoryHandler(buffer_capacity, flushLevel=logging.ERROR, target=file_handler))
+    else:
+        logger.addHandler(file_handler)
 
     # Log to file only (not console)
     logger.info(f"Logging to: {log_file} (max size: {max_bytes // 1024 // 1024}MB, {backup_count} backups)")
 
     return logger, log_file
+
+
+def flush_file_logger(logger: logging.Logger):
+    """Write any buffered records to the log file (e.g. at the end of a round)."""
+    for handler in logger.handlers:
+        handler.flush()
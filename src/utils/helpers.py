@@ -4,10 +4,39 @@ Helper utilities for SpaceIQ Bot
 Common functions used across the application.
 """
 
-from datetime import datetime, timedelta
+import re
+from datetime import datetime, timedelta, date, time
+from functools import lru_cache
 from typing import Optional
 
 
+# Characters not allowed in filenames, mapped to '_' in one translate() pass
+_FILENAME_TABLE = str.maketrans({char: '_' for char in '/\\:*?"<>|'})
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+
+
+@lru_cache(maxsize=256)
+def _parse_ymd(date_str: str) -> date:
+    """Parse a 'YYYY-MM-DD' string (cached - the bot checks the same dates repeatedly)"""
+    # Fast path: strict ISO format, sliced directly instead of going through strptime
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            return date(int(year), int(month), int(day))  # ValueError on bad ranges
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
+@lru_cache(maxsize=256)
+def _parse_hm(time_str: str) -> time:
+    """Parse a 'HH:MM' string (cached)"""
+    # Fast path: strict zero-padded format
+    if len(time_str) == 5 and time_str[2] == ':':
+        hour, minute = time_str[0:2], time_str[3:5]
+        if hour.isdigit() and minute.isdigit():
+            return time(int(hour), int(minute))  # ValueError on bad ranges
+    return datetime.strptime(time_str, '%H:%M').time()
+
+
 def format_date(date_str: Optional[str] = None, days_ahead: int = 0) -> str:
     """
     Format date for SpaceIQ booking.
@@ -27,7 +56,7 @@ def format_date(date_str: Optional[str] = None, days_ahead: int = 0) -> str:
     if date_str:
         # Validate format
         try:
-            datetime.strptime(date_str, '%Y-%m-%d')
+            _parse_ymd(date_str)
             return date_str
         except ValueError:
             raise ValueError("Date must be in 'YYYY-MM-DD' format")
@@ -50,7 +79,7 @@ def parse_time(time_str: str) -> str:
         parse_time("14:30")  # Returns "14:30"
     """
     try:
-        datetime.strptime(time_str, '%H:%M')
+        _parse_hm(time_str)
         return time_str
     except ValueError:
         raise ValueError("Time must be in 'HH:MM' format (24-hour)")
@@ -71,15 +100,20 @@ def get_business_days_ahead(num_days: int) -> str:
         get_business_days_ahead(5)  # 5 business days ahead
     """
     current_date = datetime.now()
-    business_days_added = 0
+    if num_days <= 0:
+        return current_date.strftime('%Y-%m-%d')
 
-    while business_days_added < num_days:
-        current_date += timedelta(days=1)
-        # Check if it's a weekday (Monday=0, Sunday=6)
-        if current_date.weekday() < 5:
-            business_days_added += 1
+    # Count from the most recent Friday when starting on a weekend
+    # (Monday=0, Sunday=6), so every full week of 5 business days is 7
+    # calendar days and a remainder that crosses a weekend adds 2 more
+    weekday = current_date.weekday()
+    weekend_offset = max(weekday - 4, 0)
+    weeks, extra = divmod(num_days, 5)
+    calendar_days = weeks * 7 + extra - weekend_offset
+    if extra and weekday - weekend_offset + extra >= 5:
+        calendar_days += 2
 
-    return current_date.strftime('%Y-%m-%d')
+    return (current_date + timedelta(days=calendar_days)).strftime('%Y-%m-%d')
 
 
 def validate_booking_params(location: str, date: str) -> bool:
@@ -98,12 +132,12 @@ def validate_booking_params(location: str, date: str) -> bool:
 
     # Validate date format
     try:
-        booking_date = datetime.strptime(date, '%Y-%m-%d')
+        booking_date = _parse_ymd(date)
     except ValueError:
         raise ValueError("Date must be in 'YYYY-MM-DD' format")
 
     # Check if date is not in the past
-    if booking_date.date() < datetime.now().date():
+    if booking_date < datetime.now().date():
         raise ValueError("Cannot book for a past date")
 
     return True
@@ -123,12 +157,9 @@ def sanitize_filename(filename: str) -> str:
         sanitize_filename("Book Room: 2025/10/30")  # Returns "Book_Room_2025_10_30"
     """
     # Replace invalid characters
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_FILENAME_TABLE)
 
     # Remove multiple underscores
-    while '__' in filename:
-        filename = filename.replace('__', '_')
+    filename = _MULTI_UNDERSCORE_RE.sub('_', filename)
 
     return filename.strip('_')
@@ -4,17 +4,342 @@ Saves only the logs that are displayed in the Live Logs section
 
 Features:
 - Message cleanup and deduplication
+- Append-only JSONL storage (one entry per line)
 - Automatic log rotation by count and size
 - Secure file operations with path validation
 - Robust error handling with fallback mechanisms
 """
 
+import atexit
+import errno
 import logging
 import json
+import os
+import queue
+import re
 import shutil
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, NamedTuple
+
+try:
+    import orjson  # Optional: faster C serializer
+except ImportError:
+    orjson = None
+
+
+def _dumps_bytes(data) -> bytes:
+    """Serialize to compact UTF-8 JSON (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _keyword_pattern(keywords) -> "re.Pattern":
+    """Compile a case-insensitive alternation matching any of the given substrings"""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Important booking status messages the dashboard needs (preserved as-is)
+_BOOKING_STATUS_RE = _keyword_pattern((
+    'successfully booked', 'booking verified', 'no available desks', 'already booked',
+    'success: booked', 'booking failed', 'booking verification failed',
+    'existing booking found',
+))
+
+# Operational messages the user needs to see
+_OPERATIONAL_RE = _keyword_pattern((
+    'starting round', 'checking existing bookings', 'navigating to spaceiq',
+    'attempting booking for', 'loading floor map', 'checking available',
+    'found', 'available desks', 'no available desks', 'booking verified',
+    'successfully booked', 'existing booking found',
+))
+
+# Initial startup sequence messages (filtered out)
+_STARTUP_KEYWORDS = (
+    'bot starting', 'starting bot for building', 'starting bot - building',
+    'running booking workflow - starting automated booking process', 'starting multi-date booking',
+    'using user-specific screenshots', 'cleaned up old screenshots', 'ready to book',
+)
+
+# Messages skipped entirely: huge timeout errors ("timeout" together with
+# "locator.click" or "exceeded", in either order) and startup messages
+_SKIP_RE = re.compile(
+    r'timeout.*?(?:locator\.click|exceeded)|(?:locator\.click|exceeded).*?timeout|'
+    + '|'.join(map(re.escape, _STARTUP_KEYWORDS)),
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Booking result messages that _clean_message must never drop
+_BOOKING_RESULT_RE = _keyword_pattern((
+    'booked', 'booking verified', 'successfully booked', 'booking success',
+    'booking failed', 'no available desks', 'already booked', 'existing booking found',
+))
+
+# Emojis stripped from cleaned messages
+_EMOJI_PREFIXES = ("🔧 ", "ℹ️ ", "✅ ", "❌ ", "⚠️ ", "🤖 ", "🔄 ", "📊 ", "🎯 ", "🔍 ", "✓ ", "⏳ ", "🌐 ")
+
+# Common verbose prefixes removed from the start of cleaned messages
+_VERBOSE_PREFIXES = (
+    "INFO: ",
+    "ERROR: ",
+    "WARNING: ",
+    "SUCCESS: ",
+    "DEBUG: ",
+    "BookingBot: ",
+    "SpaceIQ Bot: ",
+    "[BOT] ",
+    "[SYSTEM] ",
+    "[INFO] ",
+    "[ERROR] ",
+    "[WARNING] ",
+    "[SUCCESS] ",
+)
+
+# Completely redundant or useless messages (case-sensitive substring match)
+_USELESS_MESSAGES = (
+    "Bot starting...",
+    "Running booking workflow - Starting automated booking process",
+    "Starting Multi-Date Booking (Web Mode)",
+    "Running booking workflow",
+    "Starting bot - Building LC, Floor 2",
+    "Bot starting",
+    "Starting bot",
+    "Starting bot for building",
+    "Using user-specific screenshots directory",
+    "Cleaned up old screenshots",
+    "Ready to book",
+)
+
+# Shorten common verbose messages
+# IMPORTANT: Don't change booking success/failure messages that dashboard needs
+_MESSAGE_REPLACEMENTS = {
+    "Checking desk availability - Scanning for available desks": "Scanning desks",
+    "Found booking entries in sidebar": "Found bookings",
+    "Found booked desks": "Found booked desks",
+    "Loaded locked desks from config": "Loaded locked desks",
+    "Starting booking process for": "Booking for",
+    # Keep booking success messages intact for dashboard recognition
+    # "Successfully booked desk": "Booked desk",  # Don't change this
+    # "Failed to book desk": "Booking failed",    # Don't change this
+    # "No available desks found": "No desks available",  # Don't change this
+    "Session validation successful": "Session valid",
+    "Session validation failed": "Session invalid",
+    "Waiting for page to load": "Loading page",
+    "Clicking book button": "Confirming booking",
+    "Navigating to booking page": "Opening booking page",
+    "Extracting available desks": "Finding available desks",
+    "Filtering out locked desks": "Removing locked desks",
+    "Attempting to book desk": "Trying desk",
+    "Checking existing bookings...": "Checking existing bookings",
+    "Error fetching existing bookings: Locator.click: Timeout 3000ms exceeded": "Timeout checking existing bookings",
+    "Loading floor map for": "Loading floor map",
+    "Booking desk for - Checking availability and attempting to book": "Booking desk",
+    "Loading floor map - Date:": "Loading floor map for",
+    "Processing dates:": "Processing",
+    "Progress:": "Progress",
+    "Dates to try this round:": "Dates to try",
+}
+
+# Single-pass patterns built from the literal tables above
+_EMOJI_RE = re.compile('|'.join(map(re.escape, _EMOJI_PREFIXES)))
+# Each prefix is stripped at most once, in table order
+_VERBOSE_PREFIX_RE = re.compile('^' + ''.join(f'(?:{re.escape(p)})?' for p in _VERBOSE_PREFIXES))
+
+# Progress details that are already shown elsewhere
+_PROGRESS_RE = re.compile(r'\(Progress: \d+/\d+\)')
+_FLOOR_MAP_DATE_RE = re.compile(r'Loading floor map - Date: \d{4}-\d{2}-\d{2}')
+_BOOKING_DESK_RE = re.compile(
+    r'Booking desk for \d{4}-\d{2}-\d{2} - Checking availability and attempting to book \(Progress: \d+/\d+\)'
+)
+
+# OS errors worth retrying; anything else (missing dir, permissions) won't succeed
+_TRANSIENT_ERRNOS = frozenset({errno.EBUSY, errno.EIO, errno.EAGAIN, errno.EINTR})
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether a failed file operation may succeed on retry"""
+    if not isinstance(error, OSError):
+        return False
+    # On Windows a file held open by another process (e.g. antivirus) is a PermissionError
+    if os.name == 'nt' and isinstance(error, PermissionError):
+        return True
+    return error.errno in _TRANSIENT_ERRNOS
+
+
+def _fsync_directory(directory: Path):
+    """Persist a rename by fsyncing its parent directory (no-op on Windows)"""
+    if os.name == 'nt':
+        return
+    dir_fd = os.open(str(directory), os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+# Dates are normalized to this placeholder before the cleaning cache lookup
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_DATE_PLACEHOLDER = '0000-00-00'
+
+
+@lru_cache(maxsize=512)
+def _clean_message_cached(message: str) -> Optional[str]:
+    """Clean up redundant and verbose messages (None means skip the message)"""
+    # Remove ALL emojis and special prefixes
+    message = _EMOJI_RE.sub("", message)
+
+    # Remove common verbose prefixes
+    message = _VERBOSE_PREFIX_RE.sub("", message, count=1)
+
+    # Filter out completely redundant or useless messages
+    # But IMPORTANT: preserve booking success/failure messages for dashboard status
+    if _BOOKING_RESULT_RE.search(message):
+        # This might be an important status message, don't filter it out
+        pass
+    elif any(useless in message for useless in _USELESS_MESSAGES):
+        return None  # Signal to skip this message entirely
+
+    # Clean up specific patterns
+    # Remove round numbers and progress details that are already shown elsewhere
+    message = _PROGRESS_RE.sub('', message)
+    message = _FLOOR_MAP_DATE_RE.sub(lambda m: f"Loading floor map for {m.group().split()[-1]}", message)
+    message = _BOOKING_DESK_RE.sub(lambda m: f"Booking {m.group().split()[3]}", message)
+
+    # Shorten the first verbose phrase found, in table order
+    for pattern, replacement in _MESSAGE_REPLACEMENTS.items():
+        if pattern in message:
+            message = message.replace(pattern, replacement)
+            break
+
+    # Clean up whitespace
+    message = ' '.join(message.split())
+
+    # Skip very short or empty messages
+    if len(message) < 3:
+        return None
+
+    return message
+
+
+# Null bytes removed and carriage returns replaced in a single translate() pass
+_MESSAGE_TABLE = str.maketrans({'\x00': None, '\r': ' '})
+
+# Readable timestamp for the current second: (second, readable)
+_ts_cache = (None, None)
+
+
+def _now_strings():
+    """
+    Return (iso, readable) timestamps for now.
+
+    The ISO timestamp keeps full precision (the dashboard uses it to tell
+    entries apart); only the one-second readable string is cached, so bursts
+    of log lines within the same second skip the strftime call.
+    """
+    global _ts_cache
+    now = datetime.now()
+    second = now.replace(microsecond=0)
+    cached_second, readable = _ts_cache
+    if second != cached_second:
+        readable = second.strftime('%Y-%m-%d %H:%M:%S')
+        _ts_cache = (second, readable)
+    return now.isoformat(), readable
+
+# Background writer shared by all live loggers: add_log only enqueues, and
+# the writer thread writes everything queued within a short window at once
+_WRITE_BATCH_SECONDS = 0.25
+_write_queue: Optional[queue.Queue] = None
+_writer_thread: Optional[threading.Thread] = None
+_writer_pid: Optional[int] = None
+_writer_start_lock = threading.Lock()
+
+
+def _drain_writes(write_queue: queue.Queue):
+    """Writer thread loop: collect a batch, write it per logger, wake up waiters"""
+    while True:
+        batch = [write_queue.get()]
+        if not isinstance(batch[0], threading.Event):
+            # Let a burst of log lines accumulate before touching the disk
+            time.sleep(_WRITE_BATCH_SECONDS)
+        while True:
+            try:
+                batch.append(write_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        waiters = []
+        pending: Dict["LiveLogger", list] = {}
+        for item in batch:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                pending.setdefault(item[0], []).append(item[1:])
+
+        for live_logger, items in pending.items():
+            try:
+                live_logger._write_batch(items)
+            except Exception as e:
+                print(f"Failed to write live logs for user {live_logger.user_id}: {e}")
+
+        for waiter in waiters:
+            waiter.set()
+
+
+def _enqueue_write(item):
+    """Queue an item for the writer thread, starting it on first use (and after fork)"""
+    global _write_queue, _writer_thread, _writer_pid
+    if _writer_pid != os.getpid():
+        with _writer_start_lock:
+            if _writer_pid != os.getpid():
+                _write_queue = queue.Queue()
+                _writer_thread = threading.Thread(
+                    target=_drain_writes, args=(_write_queue,), name="LiveLoggerWriter", daemon=True
+                )
+                _writer_thread.start()
+                _writer_pid = os.getpid()
+    _write_queue.put(item)
+
+
+def _wait_for_writes(timeout: float = 2.0):
+    """Block until everything queued so far has been written (or timeout)"""
+    if _writer_pid != os.getpid() or _writer_thread is None or not _writer_thread.is_alive():
+        return
+    done = threading.Event()
+    _write_queue.put(done)
+    done.wait(timeout)
+
+
+class LogEntry(NamedTuple):
+    """Single live log entry, stored as a compact tuple (dicts only at the API/JSON boundary)"""
+    timestamp: str
+    message: str
+    level: str
+    metadata: dict
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict format used in the JSONL file and API responses"""
+        return {
+            "timestamp": self.timestamp,
+            "message": self.message,
+            "level": self.level,
+            "metadata": self.metadata
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LogEntry":
+        """Build an entry from a parsed JSONL line"""
+        return cls(
+            data.get('timestamp'),
+            data.get('message', ''),
+            data.get('level', 'info'),
+            data.get('metadata') or {}
+        )
+
 
 class LiveLogger:
     """Logger specifically for UI Live Logs display"""
@@ -25,6 +350,11 @@ class LiveLogger:
     MAX_MESSAGE_LENGTH = 1000  # Maximum message length to prevent abuse
     MAX_RETRIES = 3  # Number of retries for file operations
     BACKUP_LOGS_TO_KEEP = 3  # Number of backup log files to keep
+    MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+    DUPLICATE_WINDOW = 3  # Number of recent entries checked for duplicates
+
+    # Metadata fields that identify a log entry (timestamps etc. are ignored)
+    DEDUP_METADATA_FIELDS = ('desk', 'date', 'round', 'action', 'user_id', 'bot_id')
 
     def __init__(self, user_id: int):
         # Validate user_id
@@ -32,7 +362,40 @@ class LiveLogger:
             raise ValueError(f"Invalid user_id: {user_id}. Must be a positive integer.")
 
         self.user_id = user_id
-        self.log_dir = Path("logs")
+        self._set_log_dir(Path("logs"))
+
+        # Logs are appended to a JSONL file (one entry per line) and the
+        # most recent entries are mirrored in memory for fast reads.
+        # Nothing touches the disk until logs are first read or written.
+        self._lock = threading.RLock()
+        self._generation = 0  # Bumped when the JSONL file is rewritten
+        self._loaded = False
+        self._logs = deque(maxlen=self.MAX_LOG_ENTRIES)
+        self._line_count = 0
+        self._synced_size = None
+        self._reset_recent_keys()
+
+        # JSONL and readable text logs are kept open once created
+        self._log_dir_ready = False
+        self._closed = False
+        self._jsonl_fp = None
+        self._text_fp = None
+        atexit.register(self.close)
+
+    def _set_log_dir(self, log_dir: Path):
+        """Set the log directory and the user-specific file paths inside it"""
+        self.log_dir = log_dir
+
+        # Validate and create user-specific live log file path
+        # Prevent path traversal attacks
+        safe_user_id = str(self.user_id).replace('..', '').replace('/', '').replace('\\', '')
+        self.log_file = self.log_dir / f"live_logs_{safe_user_id}.jsonl"
+        self.text_log_file = self.log_dir / f"live_logs_{safe_user_id}.txt"
+
+    def _ensure_log_dir(self):
+        """Create the logs directory on first write"""
+        if self._log_dir_ready:
+            return
 
         # Create logs directory securely
         try:
@@ -40,30 +403,102 @@ class LiveLogger:
         except Exception as e:
             # Fallback to current directory if logs directory cannot be created
             print(f"Warning: Could not create logs directory, using current directory: {e}")
-            self.log_dir = Path(".")
+            self._set_log_dir(Path("."))
+        self._log_dir_ready = True
+
+    def _ensure_files_open(self):
+        """Open the JSONL and text log files on first write"""
+        self._ensure_log_dir()
+        if self._jsonl_fp is None:
+            self._open_log_file()
+        if self._text_fp is None:
+            self._open_text_log_file()
+
+    def _ensure_loaded(self):
+        """Load the most recent entries from disk on first use"""
+        with self._lock:
+            if self._loaded:
+                return
+            logs, self._line_count = self._read_tail()
+            self._logs = deque(logs, maxlen=self.MAX_LOG_ENTRIES)
+            self._reset_recent_keys()
+            try:
+                self._synced_size = self.log_file.stat().st_size
+            except OSError:
+                self._synced_size = None
+            self._loaded = True
+
+    def _open_log_file(self):
+        """Open the JSONL log file for appending (unbuffered: one write per batch)"""
+        self._jsonl_fp = open(self.log_file, 'ab', buffering=0)
+        self._synced_size = self._jsonl_fp.seek(0, 2)
+
+    def _open_text_log_file(self):
+        """Open the text log file for appending (unbuffered: one write per batch)"""
+        self._text_fp = open(self.text_log_file, 'ab', buffering=0)
+        self._text_log_size = self._text_fp.seek(0, 2)
+
+    @staticmethod
+    def _is_replaced(fp, path: Path) -> bool:
+        """Check whether an open handle no longer points at the file on disk"""
+        if fp is None:
+            return False
+        try:
+            on_disk = os.stat(path)
+        except OSError:
+            return True  # Removed externally
+        ours = os.fstat(fp.fileno())
+        return (ours.st_ino, ours.st_dev) != (on_disk.st_ino, on_disk.st_dev)
 
-        # Validate and create user-specific live log file path
-        # Prevent path traversal attacks
-        safe_user_id = str(user_id).replace('..', '').replace('/', '').replace('\\', '')
-        self.log_file = self.log_dir / f"live_logs_{safe_user_id}.json"
-        self.text_log_file = self.log_dir / f"live_logs_{safe_user_id}.txt"
+    def _reopen_if_replaced(self) -> bool:
+        """
+        Reopen the log files if another process replaced or removed them
 
-        # Initialize log file if it doesn't exist
-        if not self.log_file.exists():
-            self._initialize_log_file()
+        Returns:
+            True if the JSONL file was reopened (in-memory entries are stale)
+        """
+        if self._is_replaced(self._text_fp, self.text_log_file):
+            self._text_fp.close()
+            self._open_text_log_file()
+        if not self._is_replaced(self._jsonl_fp, self.log_file):
+            return False
+        self._close_log_file()
+        self._open_log_file()
+        return True
 
-    def _initialize_log_file(self):
-        """Initialize the live log file with empty structure"""
-        initial_data = {
-            "user_id": self.user_id,
-            "created_at": datetime.now().isoformat(),
-            "logs": []
-        }
+    def _reload_tail(self):
+        """Reload the in-memory entries from the JSONL file"""
+        logs, self._line_count = self._read_tail()
+        self._logs = deque(logs, maxlen=self.MAX_LOG_ENTRIES)
+        self._reset_recent_keys()
+
+    def _close_log_file(self):
+        """Close the JSONL file handle if open"""
+        if self._jsonl_fp is not None:
+            try:
+                self._jsonl_fp.close()
+            except Exception:
+                pass
+            self._jsonl_fp = None
 
-        self._write_json_with_retry(self.log_file, initial_data)
+    def _initialize_log_file(self, logs: list = None):
+        """Replace the JSONL log file with the given entries (empty by default)"""
+        logs = logs or []
+        payload = b''.join(_dumps_bytes(entry.to_dict()) + b'\n' for entry in logs)
+        self._ensure_log_dir()
 
-    def _write_json_with_retry(self, file_path: Path, data: dict, retries: int = None):
-        """Write JSON data with retry logic and atomic writes"""
+        # Release our handle first so the atomic replace also works on Windows
+        self._close_log_file()
+        try:
+            self._write_with_retry(self.log_file, payload)
+            self._line_count = len(logs)
+        finally:
+            self._open_log_file()
+            # Queued entries are either in the rewritten file already or cleared
+            self._generation += 1
+
+    def _write_with_retry(self, file_path: Path, payload: bytes, retries: int = None):
+        """Write bytes durably with atomic rename, retrying transient errors only"""
         if retries is None:
             retries = self.MAX_RETRIES
 
@@ -72,15 +507,18 @@ class LiveLogger:
         for attempt in range(retries):
             try:
                 # Write to temporary file first (atomic write pattern)
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                with open(temp_file, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
 
-                # Atomically rename temp file to target file
+                # Atomically rename temp file to target file, then persist the rename
                 temp_file.replace(file_path)
+                _fsync_directory(file_path.parent)
                 return
             except Exception as e:
-                if attempt == retries - 1:
-                    print(f"Failed to write {file_path} after {retries} attempts: {e}")
+                if attempt == retries - 1 or not _is_transient_error(e):
+                    print(f"Failed to write {file_path} after {attempt + 1} attempt(s): {e}")
                     # Try to clean up temp file
                     try:
                         if temp_file.exists():
@@ -89,82 +527,149 @@ class LiveLogger:
                         pass
                     raise
                 # Wait a bit before retrying (exponential backoff)
-                import time
                 time.sleep(0.1 * (2 ** attempt))
 
-    def _load_logs(self) -> list:
-        """Load existing logs from file with error handling"""
+    def _read_tail(self):
+        """
+        Read the last MAX_LOG_ENTRIES entries from the JSONL file
+
+        Returns:
+            Tuple of (entries, total_line_count)
+        """
         for attempt in range(self.MAX_RETRIES):
             try:
-                with open(self.log_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logs = data.get('logs', [])
+                line_count = 0
+                tail = deque(maxlen=self.MAX_LOG_ENTRIES)
+                with open(self.log_file, 'rb') as f:
+                    for line in f:
+                        tail.append(line)
+                        line_count += 1
+
+                logs = []
+                corrupted = 0
+                for line in tail:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        corrupted += 1
+                        continue
+                    if isinstance(entry, dict):
+                        logs.append(LogEntry.from_dict(entry))
 
-                    # Validate log structure
-                    if not isinstance(logs, list):
-                        print(f"Warning: Invalid log structure, resetting logs")
-                        return []
+                if corrupted:
+                    print(f"Warning: Skipped {corrupted} corrupted line(s) in {self.log_file}")
 
-                    return logs
+                return logs, line_count
             except FileNotFoundError:
-                # File doesn't exist yet, return empty list
-                return []
-            except json.JSONDecodeError as e:
-                print(f"Warning: Corrupted log file (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}")
-                if attempt == self.MAX_RETRIES - 1:
-                    # Try to backup corrupted file
-                    self._backup_corrupted_file()
-                    return []
+                # File doesn't exist yet
+                return [], 0
             except Exception as e:
                 print(f"Error loading logs (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}")
-                if attempt == self.MAX_RETRIES - 1:
-                    return []
 
-        return []
+        return [], 0
 
-    def _backup_corrupted_file(self):
-        """Backup corrupted log file for debugging"""
-        try:
-            if self.log_file.exists():
-                backup_name = f"{self.log_file.stem}_corrupted_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                backup_path = self.log_file.parent / backup_name
-                shutil.copy2(self.log_file, backup_path)
-                print(f"Backed up corrupted log file to: {backup_path}")
-        except Exception as e:
-            print(f"Failed to backup corrupted file: {e}")
+    def _load_logs(self) -> list:
+        """Load the most recent logs from file with error handling"""
+        return self._read_tail()[0]
+
+    def _refresh_if_stale(self):
+        """Reload logs if another process changed the file since our last write"""
+        with self._lock:
+            if not self._loaded:
+                self._ensure_loaded()
+                return
+            # Another process may have rewritten or removed the file (clear,
+            # rotation, cleanup) - keep appending to the file that's there now
+            try:
+                replaced = self._reopen_if_replaced()
+            except OSError:
+                replaced = True  # Couldn't reopen yet - the next write retries
+            try:
+                size = self.log_file.stat().st_size
+            except OSError:
+                size = None
+            if replaced or size != self._synced_size:
+                self._reload_tail()
+                self._synced_size = size
+
+    def _write_batch(self, items: list):
+        """
+        Write a batch of queued entries (called from the writer thread)
+
+        Args:
+            items: List of (generation, LogEntry, readable_timestamp) tuples
+        """
+        with self._lock:
+            if self._closed:
+                return
 
-    def _save_logs(self, logs: list):
-        """Save logs to file with rotation and error handling"""
+            self._ensure_files_open()
+            try:
+                replaced = self._reopen_if_replaced()
+            except OSError as e:
+                print(f"Failed to reopen live logs for user {self.user_id}: {e}")
+                replaced = False
+            self._append_logs(items)
+            if replaced:
+                # Pick up the other process's rewrite along with what we just appended
+                self._reload_tail()
+            self._save_text_logs(items)
+
+    def _append_logs(self, items: list):
+        """Append queued entries to the JSONL file in one write, rotating/compacting as needed"""
         try:
             # Check if log rotation is needed
             self._rotate_logs_if_needed()
 
-            # Prepare data
-            data = {
-                "user_id": self.user_id,
-                "updated_at": datetime.now().isoformat(),
-                "logs": logs
-            }
+            # Skip entries from before a rewrite (clear/rotation/compaction)
+            payload = b''.join(
+                _dumps_bytes(entry.to_dict()) + b'\n'
+                for generation, entry, _ in items
+                if generation == self._generation
+            )
+            if not payload:
+                return
 
-            # Write with retry logic
-            self._write_json_with_retry(self.log_file, data)
+            self._jsonl_fp.write(payload)
+            self._synced_size += len(payload)
+            self._line_count += payload.count(b'\n')
 
         except Exception as e:
             print(f"Failed to save live logs for user {self.user_id}: {e}")
             # Don't raise exception - logging should not crash the application
 
-    def _rotate_logs_if_needed(self):
-        """Rotate logs if file size exceeds threshold"""
-        try:
-            if not self.log_file.exists():
-                return
+    def flush(self):
+        """Flush pending log data to disk"""
+        _wait_for_writes()
+        with self._lock:
+            for fp in (self._jsonl_fp, self._text_fp):
+                if fp is not None:
+                    try:
+                        fp.flush()
+                    except Exception:
+                        pass
 
-            file_size_mb = self.log_file.stat().st_size / (1024 * 1024)
+    def close(self):
+        """Flush and close the log file handles"""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._close_log_file()
+            if self._text_fp is not None:
+                try:
+                    self._text_fp.close()
+                except Exception:
+                    pass
+                self._text_fp = None
 
-            if file_size_mb > self.MAX_FILE_SIZE_MB:
+    def _rotate_logs_if_needed(self):
+        """Rotate logs if file size exceeds threshold, compact if too many lines"""
+        try:
+            # Size is tracked from our own writes - no stat() per append
+            if self._synced_size > self.MAX_FILE_SIZE_BYTES:
                 # Create backup with timestamp
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_name = f"{self.log_file.stem}_backup_{timestamp}.json"
+                backup_name = f"{self.log_file.stem}_backup_{timestamp}.jsonl"
                 backup_path = self.log_file.parent / backup_name
 
                 # Copy current log to backup
@@ -174,8 +679,12 @@ class LiveLogger:
                 # Clean up old backups
                 self._cleanup_old_backups()
 
-                # Initialize new log file
-                self._initialize_log_file()
+                # Start a new log file holding only the recent entries
+                self._initialize_log_file(list(self._logs))
+
+            elif self._line_count > 2 * self.MAX_LOG_ENTRIES:
+                # Drop lines that have already fallen out of the window
+                self._initialize_log_file(list(self._logs))
 
         except Exception as e:
             print(f"Error during log rotation: {e}")
@@ -183,16 +692,22 @@ class LiveLogger:
     def _cleanup_old_backups(self):
         """Remove old backup files, keeping only the most recent ones"""
         try:
-            pattern = f"live_logs_{self.user_id}_backup_*.json"
-            backups = sorted(self.log_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+            prefix = f"live_logs_{self.user_id}_backup_"
+            with os.scandir(self.log_dir) as entries:
+                backups = [
+                    (entry.stat().st_mtime, entry)
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith('.jsonl')
+                ]
+            backups.sort(key=lambda item: item[0], reverse=True)
 
             # Remove backups beyond the limit
-            for old_backup in backups[self.BACKUP_LOGS_TO_KEEP:]:
+            for _, old_backup in backups[self.BACKUP_LOGS_TO_KEEP:]:
                 try:
-                    old_backup.unlink()
+                    os.unlink(old_backup.path)
                     print(f"Removed old backup: {old_backup.name}")
                 except Exception as e:
-                    print(f"Failed to remove old backup {old_backup}: {e}")
+                    print(f"Failed to remove old backup {old_backup.path}: {e}")
 
         except Exception as e:
             print(f"Error cleaning up old backups: {e}")
@@ -207,52 +722,24 @@ class LiveLogger:
             **metadata: Additional metadata (round, desk, date, etc.)
         """
         try:
-            # Validate and sanitize inputs
+            # Sanitize message first - this also caps its length, so every
+            # scan below works on at most MAX_MESSAGE_LENGTH characters
             message = self._sanitize_message(message)
-            level = self._validate_level(level)
 
-            # Validate metadata
-            metadata = self._sanitize_metadata(metadata)
+            # Filter out huge timeout errors and the initial startup sequence
+            # (not ongoing operations) in a single pass
+            if _SKIP_RE.search(message):
+                return  # Skip these useless messages entirely
 
-            # Filter out huge timeout errors immediately
-            if 'timeout' in message.lower() and 'locator.click' in message.lower():
-                return  # Skip these huge useless error messages entirely
-
-            # Check if this is an important booking status message that the dashboard needs
-            # If so, preserve it exactly as-is
-            message_lower = message.lower()
-            is_booking_status_message = any(keyword in message_lower for keyword in [
-                'successfully booked', 'booking verified', 'no available desks', 'already booked',
-                'success: booked', 'booking failed', 'booking verification failed',
-                'existing booking found', 'already booked'
-            ])
-
-            # Also check if this is an important operational message the user needs to see
-            is_operational_message = any(keyword in message_lower for keyword in [
-                'starting round', 'checking existing bookings', 'navigating to spaceiq',
-                'attempting booking for', 'loading floor map', 'checking available',
-                'found', 'available desks', 'no available desks', 'booking verified',
-                'successfully booked', 'existing booking found'
-            ])
-
-            # Filter out huge timeout errors immediately
-            if 'timeout' in message_lower and ('locator.click' in message_lower or 'exceeded' in message_lower):
-                return  # Skip these huge useless error messages entirely
-
-            # Only filter the initial startup sequence, not ongoing operations
-            startup_keywords = [
-                'bot starting', 'starting bot for building', 'starting bot - building',
-                'running booking workflow - starting automated booking process', 'starting multi-date booking',
-                'using user-specific screenshots', 'cleaned up old screenshots', 'ready to book'
-            ]
-            if any(keyword in message_lower for keyword in startup_keywords):
-                return  # Skip only true startup messages
+            # Validate remaining inputs only for messages we keep
+            level = self._validate_level(level)
+            metadata = self._sanitize_metadata(metadata)
 
             # Process booking status messages and operational messages
-            if is_booking_status_message:
+            if _BOOKING_STATUS_RE.search(message):
                 # Keep booking status messages as-is for dashboard
                 pass
-            elif is_operational_message:
+            elif _OPERATIONAL_RE.search(message):
                 # Keep operational messages but clean them up slightly
                 pass
             else:
@@ -270,40 +757,25 @@ class LiveLogger:
                 if message is None:
                     return
 
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "message": message,
-                "level": level,
-                "metadata": metadata
-            }
-
-            # Load existing logs
-            logs = self._load_logs()
-
-            # Check if this is a duplicate or near-duplicate of recent logs
-            if logs:
-                # Check last 3 logs for duplicates (to catch slightly different timing)
-                for recent_log in logs[-3:]:
-                    if (recent_log['message'] == message and
-                        recent_log['level'] == level):
-                        # Check if metadata is essentially the same (ignore timestamp differences)
-                        recent_metadata = recent_log.get('metadata', {})
-                        if self._metadata_equivalent(recent_metadata, metadata):
-                            # Skip duplicate
-                            return
+            # Check last few logs for duplicates (to catch slightly different timing)
+            # before building the entry - duplicates never reach the disk path
+            key = self._dedup_key(message, level, metadata)
 
-            # Add new log
-            logs.append(log_entry)
+            with self._lock:
+                self._ensure_loaded()
+                if key in self._recent_key_set:
+                    # Skip duplicate
+                    return
+                self._remember_key(key)
 
-            # Keep only last MAX_LOG_ENTRIES to prevent file from growing too large
-            if len(logs) > self.MAX_LOG_ENTRIES:
-                logs = logs[-self.MAX_LOG_ENTRIES:]
+                timestamp_iso, timestamp_readable = _now_strings()
+                log_entry = LogEntry(timestamp_iso, message, level, metadata)
 
-            # Save back to file
-            self._save_logs(logs)
+                # Add new log (deque maxlen keeps only last MAX_LOG_ENTRIES)
+                self._logs.append(log_entry)
 
-            # Also save to a readable text file for debugging
-            self._save_text_log(log_entry)
+                # Append to the JSONL file and the readable text file in the background
+                _enqueue_write((self, self._generation, log_entry, timestamp_readable))
 
         except Exception as e:
             # Log errors should never crash the application
@@ -324,7 +796,7 @@ class LiveLogger:
             message = message[:self.MAX_MESSAGE_LENGTH] + "... (truncated)"
 
         # Remove null bytes and other potentially problematic characters
-        message = message.replace('\x00', '').replace('\r', ' ').strip()
+        message = message.translate(_MESSAGE_TABLE).strip()
 
         return message
 
@@ -386,145 +858,73 @@ class LiveLogger:
         except:
             pass  # If even this fails, we give up
 
-    def _clean_message(self, message: str) -> str:
+    def _clean_message(self, message: str) -> Optional[str]:
         """Clean up redundant and verbose messages"""
-        # Remove ALL emojis and special prefixes
-        emoji_prefixes = ["🔧 ", "ℹ️ ", "✅ ", "❌ ", "⚠️ ", "🤖 ", "🔄 ", "📊 ", "🎯 ", "🔍 ", "✓ ", "⏳ ", "🌐 "]
-        for emoji in emoji_prefixes:
-            message = message.replace(emoji, "")
-
-        # Remove common verbose prefixes
-        prefixes_to_remove = [
-            "INFO: ",
-            "ERROR: ",
-            "WARNING: ",
-            "SUCCESS: ",
-            "DEBUG: ",
-            "BookingBot: ",
-            "SpaceIQ Bot: ",
-            "[BOT] ",
-            "[SYSTEM] ",
-            "[INFO] ",
-            "[ERROR] ",
-            "[WARNING] ",
-            "[SUCCESS] ",
-        ]
-
-        for prefix in prefixes_to_remove:
-            if message.startswith(prefix):
-                message = message[len(prefix):]
-
-        # Filter out completely redundant or useless messages
-        # But IMPORTANT: preserve booking success/failure messages for dashboard status
-        useless_messages = [
-            "Bot starting...",
-            "Running booking workflow - Starting automated booking process",
-            "Starting Multi-Date Booking (Web Mode)",
-            "Running booking workflow",
-            "Starting bot - Building LC, Floor 2",
-            "Bot starting",
-            "Starting bot",
-            "Starting bot for building",
-            "Using user-specific screenshots directory",
-            "Cleaned up old screenshots",
-            "Ready to book",
-        ]
-
-        # Don't filter out messages that contain booking results (needed for dashboard)
-        message_lower = message.lower()
-        if any(keyword in message_lower for keyword in [
-            'booked', 'booking verified', 'successfully booked', 'booking success',
-            'booking failed', 'no available desks', 'already booked', 'existing booking found'
-        ]):
-            # This might be an important status message, don't filter it out
-            pass
-        elif any(useless in message for useless in useless_messages):
-            return None  # Signal to skip this message entirely
-
-        # Shorten common verbose messages
-        # IMPORTANT: Don't change booking success/failure messages that dashboard needs
-        replacements = {
-            "Checking desk availability - Scanning for available desks": "Scanning desks",
-            "Found booking entries in sidebar": "Found bookings",
-            "Found booked desks": "Found booked desks",
-            "Loaded locked desks from config": "Loaded locked desks",
-            "Starting booking process for": "Booking for",
-            # Keep booking success messages intact for dashboard recognition
-            # "Successfully booked desk": "Booked desk",  # Don't change this
-            # "Failed to book desk": "Booking failed",    # Don't change this
-            # "No available desks found": "No desks available",  # Don't change this
-            "Session validation successful": "Session valid",
-            "Session validation failed": "Session invalid",
-            "Waiting for page to load": "Loading page",
-            "Clicking book button": "Confirming booking",
-            "Navigating to booking page": "Opening booking page",
-            "Extracting available desks": "Finding available desks",
-            "Filtering out locked desks": "Removing locked desks",
-            "Attempting to book desk": "Trying desk",
-            "Checking existing bookings...": "Checking existing bookings",
-            "Error fetching existing bookings: Locator.click: Timeout 3000ms exceeded": "Timeout checking existing bookings",
-            "Loading floor map for": "Loading floor map",
-            "Booking desk for - Checking availability and attempting to book": "Booking desk",
-            "Loading floor map - Date:": "Loading floor map for",
-            "Checking desk availability - Scanning for available desks": "Scanning desks",
-            "Processing dates:": "Processing",
-            "Progress:": "Progress",
-            "Dates to try this round:": "Dates to try",
-        }
-
-        # Clean up specific patterns
-        import re
-        # Remove round numbers and progress details that are already shown elsewhere
-        message = re.sub(r'\(Progress: \d+/\d+\)', '', message)
-        message = re.sub(r'Loading floor map - Date: \d{4}-\d{2}-\d{2}', lambda m: f"Loading floor map for {m.group().split()[-1]}", message)
-        message = re.sub(r'Booking desk for \d{4}-\d{2}-\d{2} - Checking availability and attempting to book \(Progress: \d+/\d+\)',
-                         lambda m: f"Booking {m.group().split()[3]}", message)
-
-        for pattern, replacement in replacements.items():
-            if pattern in message:
-                message = message.replace(pattern, replacement)
-                break
-
-        # Clean up whitespace
-        message = ' '.join(message.split())
-
-        # Skip very short or empty messages
-        if len(message) < 3:
+        # Cache on the message with dates normalized, so "Booking 2025-11-04"
+        # and "Booking 2025-11-05" share one cached cleaning result
+        dates = _DATE_RE.findall(message)
+        if not dates or _DATE_PLACEHOLDER in message:
+            return _clean_message_cached(message)
+
+        cleaned = _clean_message_cached(_DATE_RE.sub(_DATE_PLACEHOLDER, message))
+        if cleaned is None:
             return None
 
-        return message
-
-    def _metadata_equivalent(self, metadata1: dict, metadata2: dict) -> bool:
-        """Check if two metadata dictionaries are essentially equivalent"""
-        # Remove timestamp and other dynamic fields for comparison
-        static_fields = ['desk', 'date', 'round', 'action', 'user_id', 'bot_id']
-
-        for field in static_fields:
-            if metadata1.get(field) != metadata2.get(field):
-                return False
-
-        return True
-
-    def _save_text_log(self, log_entry):
-        """Save log entry to readable text file with size limits"""
+        parts = cleaned.split(_DATE_PLACEHOLDER)
+        if len(parts) != len(dates) + 1:
+            # Cleaning changed the dates (never expected) - clean the raw message instead
+            return _clean_message_cached(message)
+
+        # Put the original dates back, in order
+        restored = [parts[0]]
+        for date_str, part in zip(dates, parts[1:]):
+            restored.append(date_str)
+            restored.append(part)
+        return ''.join(restored)
+
+    def _dedup_key(self, message: str, level: str, metadata: dict) -> tuple:
+        """Build the hashable identity of a log entry (ignores dynamic metadata)"""
+        return (message, level) + tuple(metadata.get(field) for field in self.DEDUP_METADATA_FIELDS)
+
+    def _remember_key(self, key: tuple):
+        """Track a key in the recent-duplicates window"""
+        if len(self._recent_keys) == self.DUPLICATE_WINDOW:
+            self._recent_key_set.discard(self._recent_keys[0])
+        self._recent_keys.append(key)
+        self._recent_key_set.add(key)
+
+    def _reset_recent_keys(self):
+        """Rebuild the recent-duplicates window from the in-memory logs"""
+        self._recent_keys = deque(maxlen=self.DUPLICATE_WINDOW)
+        self._recent_key_set = set()
+        start = max(len(self._logs) - self.DUPLICATE_WINDOW, 0)
+        for i in range(start, len(self._logs)):
+            entry = self._logs[i]
+            self._remember_key(self._dedup_key(entry.message, entry.level, entry.metadata))
+
+    def _save_text_logs(self, items: list):
+        """Save queued entries to the readable text file in one write, with size limits"""
         try:
-            # Check if text log file needs rotation
-            if self.text_log_file.exists():
-                file_size_mb = self.text_log_file.stat().st_size / (1024 * 1024)
-                if file_size_mb > self.MAX_FILE_SIZE_MB:
-                    # Rotate text log file
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    backup_name = f"{self.text_log_file.stem}_backup_{timestamp}.txt"
-                    backup_path = self.text_log_file.parent / backup_name
+            # Check if text log file needs rotation (size tracked in memory)
+            if self._text_log_size > self.MAX_FILE_SIZE_BYTES:
+                # Rotate text log file (close first so the move also works on Windows)
+                self._text_fp.close()
+                self._text_fp = None
+                backup_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                backup_name = f"{self.text_log_file.stem}_backup_{backup_stamp}.txt"
+                backup_path = self.text_log_file.parent / backup_name
+                try:
                     shutil.move(str(self.text_log_file), str(backup_path))
                     print(f"Rotated text log file to: {backup_path}")
+                finally:
+                    self._open_text_log_file()
 
-            timestamp = datetime.fromisoformat(log_entry['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-            level = log_entry['level'].upper()
-            message = log_entry['message']
-
-            with open(self.text_log_file, 'a', encoding='utf-8') as f:
-                f.write(f"[{timestamp}] [{level}] {message}\n")
+            payload = ''.join(
+                f"[{timestamp}] [{entry.level.upper()}] {entry.message}\n"
+                for _, entry, timestamp in items
+            ).encode('utf-8')
+            self._text_fp.write(payload)
+            self._text_log_size += len(payload)
 
         except Exception as e:
             print(f"Failed to save text log for user {self.user_id}: {e}")
@@ -539,16 +939,24 @@ class LiveLogger:
         Returns:
             List of recent log entries
         """
-        logs = self._load_logs()
-        return logs[-limit:] if logs else []
+        self._refresh_if_stale()
+        with self._lock:
+            logs = list(self._logs)
+        return [entry.to_dict() for entry in logs[-limit:]] if logs else []
 
     def clear_logs(self):
         """Clear all logs"""
-        self._initialize_log_file()
+        with self._lock:
+            self._initialize_log_file()
+            self._logs.clear()
+            self._reset_recent_keys()
+            self._loaded = True
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the logs"""
-        logs = self._load_logs()
+        self._refresh_if_stale()
+        with self._lock:
+            logs = list(self._logs)
 
         if not logs:
             return {
@@ -560,48 +968,53 @@ class LiveLogger:
         # Count by level
         level_counts = {}
         for log in logs:
-            level = log.get('level', 'info')
-            level_counts[level] = level_counts.get(level, 0) + 1
+            level_counts[log.level] = level_counts.get(log.level, 0) + 1
 
         return {
             "total_logs": len(logs),
             "levels": level_counts,
-            "latest_log": logs[-1] if logs else None,
-            "oldest_log": logs[0] if logs else None
+            "latest_log": logs[-1].to_dict() if logs else None,
+            "oldest_log": logs[0].to_dict() if logs else None
         }
 
 
 # Global dictionary to hold live loggers for each user
 _live_loggers: Dict[int, LiveLogger] = {}
+_live_loggers_lock = threading.Lock()
 
 def get_live_logger(user_id: int) -> LiveLogger:
     """Get or create a live logger for a user"""
-    global _live_loggers
+    # Fast path: single lock-free lookup for existing loggers
+    live_logger = _live_loggers.get(user_id)
+    if live_logger is not None:
+        return live_logger
 
-    if user_id not in _live_loggers:
-        _live_loggers[user_id] = LiveLogger(user_id)
-
-    return _live_loggers[user_id]
+    # Slow path: create under lock so concurrent callers share one instance
+    with _live_loggers_lock:
+        live_logger = _live_loggers.get(user_id)
+        if live_logger is None:
+            live_logger = _live_loggers[user_id] = LiveLogger(user_id)
+        return live_logger
 
 
 def cleanup_old_live_logs():
     """Clean up live logs for inactive users"""
     try:
-        import glob
-
-        # Find all live log files
-        live_log_files = glob.glob("logs/live_logs_*.json")
+        cutoff = datetime.now().timestamp() - 7 * 24 * 3600
 
-        for log_file in live_log_files:
-            file_path = Path(log_file)
+        # Find all live log files (.jsonl and legacy .json)
+        with os.scandir("logs") as entries:
+            for entry in entries:
+                if not entry.name.startswith("live_logs_") or not entry.name.endswith((".jsonl", ".json")):
+                    continue
 
-            # Check if file is older than 7 days
-            if file_path.stat().st_mtime < (datetime.now().timestamp() - 7 * 24 * 3600):
-                try:
-                    file_path.unlink()
-                    print(f"Cleaned up old live log file: {file_path}")
-                except Exception as e:
-                    print(f"Failed to clean up {file_path}: {e}")
+                # Check if file is older than 7 days
+                if entry.stat().st_mtime < cutoff:
+                    try:
+                        os.unlink(entry.path)
+                        print(f"Cleaned up old live log file: {entry.path}")
+                    except Exception as e:
+                        print(f"Failed to clean up {entry.path}: {e}")
 
     except Exception as e:
         print(f"Error during live log cleanup: {e}")
\ No newline at end of file
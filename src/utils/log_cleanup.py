@@ -4,12 +4,72 @@ Log File Cleanup Utility
 Automatically cleans up old log files, keeping only the most recent sessions.
 """
 
-import re
+import os
+from collections import defaultdict
 from pathlib import Path
-from typing import Set
+from typing import Optional
 import logging
 
 
+def _session_timestamp(filename: str) -> Optional[str]:
+    """
+    Extract the session timestamp from a log filename without a regex.
+
+    Examples: booking_20251026_214544.log, console_20251026_214544.log
+
+    Returns:
+        'YYYYMMDD_HHMMSS' or None if the name doesn't end with a timestamp
+    """
+    parts = filename[:-4].rsplit('_', 2)  # strip '.log'
+    if (len(parts) >= 2 and len(parts[-2]) == 8 and len(parts[-1]) == 6
+            and parts[-2].isdigit() and parts[-1].isdigit()):
+        return f"{parts[-2]}_{parts[-1]}"
+    return None
+
+
+def _delete_files(directory: Path, names: list, logger=None) -> int:
+    """
+    Delete files by name from a directory.
+
+    Where supported (Linux/macOS) the directory is opened once and each file
+    is removed relative to it (unlinkat), so the kernel doesn't re-resolve
+    the directory path for every file.
+
+    Returns:
+        Number of files deleted
+    """
+    dir_fd = None
+    if names and os.unlink in os.supports_dir_fd:
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            dir_fd = None
+
+    deleted_count = 0
+    try:
+        for name in names:
+            try:
+                if dir_fd is not None:
+                    os.unlink(name, dir_fd=dir_fd)
+                else:
+                    os.unlink(os.path.join(directory, name))
+                deleted_count += 1
+            except FileNotFoundError:
+                # Already removed (e.g. by a concurrent cleanup) - same end result
+                deleted_count += 1
+            except Exception as e:
+                msg = f"Failed to delete {name}: {e}"
+                # Verbose output suppressed
+                # print(f"[CLEANUP] {msg}")
+                if logger:
+                    logger.warning(msg)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    return deleted_count
+
+
 def cleanup_old_logs(logs_dir: Path = None, keep_sessions: int = 2, logger=None):
     """
     Clean up old log files, keeping only the most recent sessions.
@@ -25,21 +85,23 @@ def cleanup_old_logs(logs_dir: Path = None, keep_sessions: int = 2, logger=None)
     if not logs_dir.exists():
         return
 
-    # Pattern to extract session timestamp from filename
-    # Examples: booking_20251026_214544.log, console_20251026_214544.log
-    timestamp_pattern = re.compile(r'(\d{8}_\d{6})')
+    # Find all log files with timestamps, grouped by session timestamp
+    sessions = defaultdict(list)
+    counts = {}
 
-    # Find all log files with timestamps
-    log_files = []
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith('.log') or not entry.is_file(follow_symlinks=False):
+                continue
 
-    for file in logs_dir.glob("*.log"):
-        # Extract timestamp
-        match = timestamp_pattern.search(file.name)
-        if match:
-            timestamp = match.group(1)
-            log_files.append((timestamp, file))
+            # Extract timestamp
+            timestamp = _session_timestamp(name)
+            if timestamp:
+                sessions[timestamp].append(name)
+                counts[timestamp] = counts.get(timestamp, 0) + 1
 
-    if not log_files:
+    if not sessions:
         msg = "No log files to clean up"
         # Verbose output suppressed
         # print(f"[CLEANUP] {msg}")
@@ -47,19 +109,12 @@ def cleanup_old_logs(logs_dir: Path = None, keep_sessions: int = 2, logger=None)
             logger.info(msg)
         return
 
-    # Group log files by session timestamp
-    sessions = {}
-    for timestamp, file in log_files:
-        if timestamp not in sessions:
-            sessions[timestamp] = []
-        sessions[timestamp].append(file)
-
     # Sort sessions by timestamp (most recent first)
     sorted_sessions = sorted(sessions.keys(), reverse=True)
 
-    # Keep only the most recent N sessions
-    sessions_to_keep = set(sorted_sessions[:keep_sessions])
-    sessions_to_delete = set(sorted_sessions[keep_sessions:])
+    # Keep only the most recent N sessions (slices stay most-recent-first)
+    sessions_to_keep = sorted_sessions[:keep_sessions]
+    sessions_to_delete = sorted_sessions[keep_sessions:]
 
     if not sessions_to_delete:
         msg = f"All log files are from recent sessions (keeping {len(sessions_to_keep)} session(s))"
@@ -70,21 +125,11 @@ def cleanup_old_logs(logs_dir: Path = None, keep_sessions: int = 2, logger=None)
         return
 
     # Delete old log files
-    deleted_count = 0
-    for session_timestamp in sessions_to_delete:
-        for file in sessions[session_timestamp]:
-            try:
-                file.unlink()
-                deleted_count += 1
-            except Exception as e:
-                msg = f"Failed to delete {file.name}: {e}"
-                # Verbose output suppressed
-                # print(f"[CLEANUP] {msg}")
-                if logger:
-                    logger.warning(msg)
+    doomed = [name for session_timestamp in sessions_to_delete for name in sessions[session_timestamp]]
+    deleted_count = _delete_files(logs_dir, doomed, logger)
 
     # Summary
-    kept_count = sum(len(sessions[ts]) for ts in sessions_to_keep)
+    kept_count = sum(counts[ts] for ts in sessions_to_keep)
     msg = f"Deleted {deleted_count} old log file(s) from {len(sessions_to_delete)} session(s), kept {kept_count} from {len(sessions_to_keep)} recent session(s)"
     # Verbose output suppressed
     # print(f"[CLEANUP] {msg}")
@@ -93,8 +138,8 @@ def cleanup_old_logs(logs_dir: Path = None, keep_sessions: int = 2, logger=None)
 
     # Log details
     if logger:
-        logger.info(f"Log sessions kept: {sorted(sessions_to_keep, reverse=True)}")
-        logger.info(f"Log sessions deleted: {sorted(sessions_to_delete, reverse=True)}")
+        logger.info(f"Log sessions kept: {sessions_to_keep}")
+        logger.info(f"Log sessions deleted: {sessions_to_delete}")
 
 
 if __name__ == "__main__":
@@ -10,12 +10,47 @@ Provides consistent logging format across the application with:
 
 import logging
 import traceback
+import atexit
 import json
+import queue
+import sys
+import threading
+from collections import Counter, deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 from config import Config
 
+# Banner separators, built once
+_HR = "=" * 70
+_HR_CRITICAL = "=" * 80
+
+try:
+    import orjson  # Optional: faster C serializer
+except ImportError:
+    orjson = None
+
+
+def _dumps_line(data) -> bytes:
+    """Serialize one JSONL record to UTF-8 bytes (orjson when available)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data) + b'\n'
+        except TypeError:
+            pass  # e.g. non-str keys in context; stdlib json coerces them
+    return json.dumps(data).encode('utf-8') + b'\n'
+
+
+def _loads(line):
+    """Parse one JSONL record from bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+# Loggers already configured by setup_logger, keyed by name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
 
 def setup_logger(name: str = "SpaceIQBot", level: int = logging.INFO) -> logging.Logger:
     """
@@ -28,12 +63,19 @@ def setup_logger(name: str = "SpaceIQBot", level: int = logging.INFO) -> logging
     Returns:
         Configured logger instance
     """
+    logger = _LOGGER_CACHE.get(name)
+    if logger is not None:
+        # setLevel clears every logger's level cache, so only call it on a change
+        if logger.level != level:
+            logger.setLevel(level)
+        return logger
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     # Avoid duplicate handlers
     if logger.handlers:
+        _LOGGER_CACHE[name] = logger
         return logger
 
     # Console handler
@@ -48,6 +90,7 @@ def setup_logger(name: str = "SpaceIQBot", level: int = logging.INFO) -> logging
     console_handler.setFormatter(formatter)
 
     logger.addHandler(console_handler)
+    _LOGGER_CACHE[name] = logger
 
     return logger
 
@@ -60,13 +103,13 @@ def log_workflow_start(workflow_name: str, params: dict = None):
         workflow_name: Name of the workflow
         params: Dictionary of workflow parameters
     """
-    print("\n" + "=" * 70)
-    print(f"🚀 Starting: {workflow_name}")
-    print("=" * 70)
+    parts = ["\n" + _HR, f"🚀 Starting: {workflow_name}", _HR]
     if params:
-        for key, value in params.items():
-            print(f"   {key}: {value}")
-    print("=" * 70 + "\n")
+        parts.extend(f"   {key}: {value}" for key, value in params.items())
+    parts.append(_HR + "\n")
+    # One write for the whole banner instead of a print per line
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()
 
 
 def log_workflow_end(workflow_name: str, success: bool, duration: float = None):
@@ -81,11 +124,12 @@ def log_workflow_end(workflow_name: str, success: bool, duration: float = None):
     symbol = "✅" if success else "❌"
     status = "SUCCESS" if success else "FAILED"
 
-    print("\n" + "=" * 70)
-    print(f"{symbol} {workflow_name}: {status}")
+    parts = ["\n" + _HR, f"{symbol} {workflow_name}: {status}"]
     if duration:
-        print(f"   Duration: {duration:.2f} seconds")
-    print("=" * 70 + "\n")
+        parts.append(f"   Duration: {duration:.2f} seconds")
+    parts.append(_HR + "\n")
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()
 
 
 # ========== Enhanced Error Logging and Debugging ==========
@@ -95,7 +139,7 @@ class ErrorTracker:
     Track and log errors with comprehensive debugging information
     """
 
-    def __init__(self, log_dir: Path = None):
+    def __init__(self, log_dir: Path = None, enabled_levels: Optional[set] = None):
         if log_dir is None:
             log_dir = Path("logs") / "errors"
 
@@ -105,12 +149,70 @@ class ErrorTracker:
         self.error_log_file = self.log_dir / "error_log.jsonl"  # JSON Lines format
         self.critical_log_file = self.log_dir / "critical_errors.txt"
 
+        # Every level is logged unless the caller narrows it down; levels outside
+        # the set are dropped before any record/context is built
+        self._enabled_levels = (
+            frozenset(level.lower() for level in enabled_levels) if enabled_levels is not None else None
+        )
+
+        # JSONL lines are written by a background thread so log_error only enqueues
+        self._q = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="ErrorLogWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _writer_loop(self):
+        """Background loop: keep the error log open and write queued lines in batches"""
+        f = None
+        try:
+            f = open(self.error_log_file, 'ab')
+        except Exception as e:
+            print(f"Failed to open error log: {e}")
+
+        while True:
+            lines = [self._q.get()]
+            # Drain whatever else is queued so a burst becomes one write
+            while True:
+                try:
+                    lines.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in lines
+            try:
+                if f is not None:
+                    f.write(b''.join(line for line in lines if line is not None))
+                    f.flush()
+            except Exception as e:
+                print(f"Failed to write error log: {e}")
+            finally:
+                for _ in lines:
+                    self._q.task_done()
+
+            if stop:
+                break
+
+        if f is not None:
+            f.close()
+
+    def flush(self):
+        """Block until all queued error lines have been written"""
+        if self._writer.is_alive():
+            self._q.join()
+
+    def close(self):
+        """Write remaining queued lines and stop the writer thread"""
+        if self._writer.is_alive():
+            self._q.put(None)
+            self._writer.join(timeout=2)
+
     def log_error(
         self,
         error: Exception,
         context: Optional[Dict[str, Any]] = None,
         level: str = "error",
-        user_id: Optional[int] = None
+        user_id: Optional[int] = None,
+        capture_stack: bool = True
     ):
         """
         Log an error with full context and stack trace
@@ -120,21 +222,76 @@ class ErrorTracker:
             context: Additional context information
             level: Error level (error, warning, critical)
             user_id: Optional user ID for multi-user tracking
+            capture_stack: Format the stack trace (error/critical only); hot paths can opt out
         """
+        if not self._is_enabled(level):
+            return
+
+        # Plain errors without a user are the common case and take the short path
+        if level == "error" and user_id is None:
+            return self._log_error_fast(error, context, capture_stack)
+        return self._log_error_generic(error, context, level, user_id, capture_stack)
+
+    def _is_enabled(self, level: str) -> bool:
+        """Check a level against enabled_levels (case-insensitive; all levels if unset)"""
+        return self._enabled_levels is None or level.lower() in self._enabled_levels
+
+    @staticmethod
+    def _format_stack(error: Exception) -> str:
+        """Format the traceback of an error (expensive, so only called where it is read)"""
+        if error.__traceback__ is not None:
+            return "".join(
+                traceback.format_exception(type(error), error, error.__traceback__, limit=20)
+            )
+        return traceback.format_exc()
+
+    def _log_error_fast(
+        self,
+        error: Exception,
+        context: Optional[Dict[str, Any]] = None,
+        capture_stack: bool = True
+    ):
+        """log_error specialized for level="error" with no user ID (no critical-file branch)"""
+        try:
+            self._q.put_nowait(_dumps_line({
+                "timestamp": datetime.now().isoformat(),
+                "level": "error",
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+                "stack_trace": self._format_stack(error) if capture_stack else None,
+                "context": context or {},
+                "user_id": None
+            }))
+        except Exception as e:
+            print(f"Failed to write error log: {e}")
+
+    def _log_error_generic(
+        self,
+        error: Exception,
+        context: Optional[Dict[str, Any]],
+        level: str,
+        user_id: Optional[int],
+        capture_stack: bool
+    ):
+        """log_error for any level/user, including the critical error file"""
+        stack_trace = None
+        if capture_stack and level in ("error", "critical"):
+            stack_trace = self._format_stack(error)
+
+        now = datetime.now()  # One clock read shared by the JSONL record and critical log
         error_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "level": level,
             "error_type": type(error).__name__,
             "error_message": str(error),
-            "stack_trace": traceback.format_exc(),
+            "stack_trace": stack_trace,
             "context": context or {},
             "user_id": user_id
         }
 
-        # Write to JSON Lines file for structured logging
+        # Queue for the JSON Lines file (structured logging)
         try:
-            with open(self.error_log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(error_data) + '\n')
+            self._q.put_nowait(_dumps_line(error_data))
         except Exception as e:
             print(f"Failed to write error log: {e}")
 
@@ -142,16 +299,17 @@ class ErrorTracker:
         if level == "critical":
             try:
                 with open(self.critical_log_file, 'a', encoding='utf-8') as f:
-                    f.write(f"\n{'='*80}\n")
-                    f.write(f"CRITICAL ERROR - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"{'='*80}\n")
+                    f.write(f"\n{_HR_CRITICAL}\n")
+                    f.write(f"CRITICAL ERROR - {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write(f"{_HR_CRITICAL}\n")
                     f.write(f"Type: {type(error).__name__}\n")
                     f.write(f"Message: {str(error)}\n")
                     if user_id:
                         f.write(f"User ID: {user_id}\n")
                     if context:
                         f.write(f"Context: {json.dumps(context, indent=2)}\n")
-                    f.write(f"\nStack Trace:\n{traceback.format_exc()}\n")
+                    if stack_trace:
+                        f.write(f"\nStack Trace:\n{stack_trace}\n")
             except Exception as e:
                 print(f"Failed to write critical error log: {e}")
 
@@ -173,6 +331,9 @@ class ErrorTracker:
             user_id: User ID
             additional_context: Additional context information
         """
+        if not self._is_enabled("error"):
+            return
+
         context = {
             "booking_date": date,
             "desk_code": desk,
@@ -180,7 +341,10 @@ class ErrorTracker:
             **(additional_context or {})
         }
 
-        self.log_error(error, context=context, level="error", user_id=user_id)
+        if user_id is None:
+            self._log_error_fast(error, context)
+        else:
+            self._log_error_generic(error, context, "error", user_id, True)
 
     def log_session_error(
         self,
@@ -196,12 +360,18 @@ class ErrorTracker:
             session_file: Path to session file
             user_id: User ID
         """
+        if not self._is_enabled("error"):
+            return
+
         context = {
             "workflow": "session_management",
             "session_file": session_file,
         }
 
-        self.log_error(error, context=context, level="error", user_id=user_id)
+        if user_id is None:
+            self._log_error_fast(error, context)
+        else:
+            self._log_error_generic(error, context, "error", user_id, True)
 
     def get_recent_errors(self, limit: int = 50) -> list:
         """
@@ -214,18 +384,21 @@ class ErrorTracker:
             List of error dictionaries
         """
         try:
+            # Make sure queued errors are on disk before reading
+            self.flush()
+
             if not self.error_log_file.exists():
                 return []
 
             errors = []
-            with open(self.error_log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            # Only the last N lines are kept in memory while streaming the file
+            with open(self.error_log_file, 'rb') as f:
+                lines = deque(f, maxlen=limit if limit > 0 else None)
 
-            # Get last N lines
-            for line in lines[-limit:]:
+            for line in lines:
                 try:
-                    errors.append(json.loads(line))
-                except json.JSONDecodeError:
+                    errors.append(_loads(line))
+                except ValueError:  # JSONDecodeError (stdlib and orjson) subclasses ValueError
                     continue
 
             return errors
@@ -251,29 +424,23 @@ class ErrorTracker:
                     "by_user": {}
                 }
 
-            error_types = {}
-            error_levels = {}
-            error_users = {}
+            # Collect keys in one pass; Counter does the tallying in C
+            error_types = []
+            error_levels = []
+            error_users = []
 
             for error in errors:
-                # Count by type
-                error_type = error.get('error_type', 'Unknown')
-                error_types[error_type] = error_types.get(error_type, 0) + 1
-
-                # Count by level
-                level = error.get('level', 'unknown')
-                error_levels[level] = error_levels.get(level, 0) + 1
-
-                # Count by user
+                error_types.append(error.get('error_type', 'Unknown'))
+                error_levels.append(error.get('level', 'unknown'))
                 user_id = error.get('user_id')
                 if user_id:
-                    error_users[user_id] = error_users.get(user_id, 0) + 1
+                    error_users.append(user_id)
 
             return {
                 "total_errors": len(errors),
-                "by_type": error_types,
-                "by_level": error_levels,
-                "by_user": error_users,
+                "by_type": dict(Counter(error_types)),
+                "by_level": dict(Counter(error_levels)),
+                "by_user": dict(Counter(error_users)),
                 "latest_error": errors[-1] if errors else None
             }
         except Exception as e:
@@ -21,6 +21,66 @@ if os.name == 'nt':  # Windows
         pass
 
 
+# Rule lines, built once
+_HR = "=" * 70
+_HR_DASH = "─" * 70
+
+# Precomputed color prefixes/suffixes so each call only joins the message text
+_RESET = Style.RESET_ALL
+_OK = Fore.GREEN + "✓ "
+_ERR = Fore.RED + "✗ "
+_WARN = Fore.YELLOW + "⚠ "
+_INFO = Fore.CYAN + "ℹ "
+_HEADER = Fore.CYAN + Style.BRIGHT
+_GRAY = Fore.LIGHTBLACK_EX
+_STEP_OK = " " + Fore.GREEN + "✓" + _RESET
+_STEP_FAIL = " " + Fore.RED + "✗" + _RESET
+_DATE_HEADER = "\n" + Fore.MAGENTA + Style.BRIGHT
+_BOOKED = Fore.GREEN + Style.BRIGHT + "✓ BOOKED" + _RESET + " "
+_SKIPPED = Fore.YELLOW + "○ SKIPPED" + _RESET + " "
+_NO_DESKS = " " + Fore.LIGHTBLACK_EX + "(no available desks)" + _RESET
+_WAITING = "\n" + Fore.YELLOW + "⏳ "
+_PROGRESS = "\r" + Fore.LIGHTBLACK_EX
+_CLEAR_LINE = "\r" + " " * 80 + "\r"
+
+# summary_table pieces
+_SUMMARY_TITLE = f"\n{Fore.CYAN}{Style.BRIGHT}{'SUMMARY':^70}{_RESET}"
+_SUMMARY_RULE = f"{Fore.CYAN}{_HR_DASH}{_RESET}"
+_ALREADY_BOOKED = f"{Fore.GREEN}Already Booked:{_RESET} "
+_NEWLY_BOOKED = f"{Fore.GREEN}Newly Booked:{_RESET} "
+_NONE_BOOKED = f"{Fore.YELLOW}Newly Booked:{_RESET} 0 dates"
+_SKIPPED_TITLE = f"\n{Fore.YELLOW}Skipped:{_RESET} "
+_NO_SEATS = f" dates {Fore.LIGHTBLACK_EX}(no seats available){_RESET}"
+_DATE_OK = f"  {Fore.GREEN}✓{_RESET} "
+_DATE_SKIPPED = f"  {Fore.LIGHTBLACK_EX}○ "
+
+# round_header pieces
+_ROUND_TOP = f"\n{Fore.MAGENTA}{Style.BRIGHT}{_HR}"
+_ROUND_BOTTOM = f"{_HR}{_RESET}"
+_ROUND_TRYING = Fore.CYAN + "Trying "
+
+_MODE_BANNERS = {
+    "headless": (
+        f"{Fore.BLUE}{Style.BRIGHT}HEADLESS MODE{_RESET}",
+        f"{Fore.LIGHTBLACK_EX}Background operation • Checks existing bookings • Continuous loop • Ctrl+C to stop{_RESET}"
+    ),
+    "loop": (
+        f"{Fore.MAGENTA}{Style.BRIGHT}CONTINUOUS LOOP MODE{_RESET}",
+        f"{Fore.YELLOW}Keeps trying all dates forever • Press Ctrl+C to stop{_RESET}"
+    ),
+    "poll": (
+        f"{Fore.CYAN}{Style.BRIGHT}POLLING MODE{_RESET}",
+        f"{Fore.YELLOW}Keeps trying until at least one booking succeeds{_RESET}"
+    )
+}
+
+
+def _emit(parts: list):
+    """Write several output lines with a single write call"""
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
+
+
 class PrettyOutput:
     """Handles pretty, colored terminal output"""
 
@@ -38,58 +98,53 @@ class PrettyOutput:
     @staticmethod
     def header(text: str, char: str = "="):
         """Print a colored header"""
-        line = char * 70
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}{line}")
-        print(f"{text:^70}")
-        print(f"{line}{Style.RESET_ALL}\n")
+        line = _HR if char == "=" else char * 70
+        _emit((f"\n{_HEADER}{line}\n", f"{text:^70}\n", f"{line}{_RESET}\n\n"))
 
     @staticmethod
     def success(text: str):
         """Print success message in green"""
-        print(f"{Fore.GREEN}✓ {text}{Style.RESET_ALL}")
+        print(f"{_OK}{text}{_RESET}")
 
     @staticmethod
     def error(text: str):
         """Print error message in red"""
-        print(f"{Fore.RED}✗ {text}{Style.RESET_ALL}")
+        print(f"{_ERR}{text}{_RESET}")
 
     @staticmethod
     def warning(text: str):
         """Print warning message in yellow"""
-        print(f"{Fore.YELLOW}⚠ {text}{Style.RESET_ALL}")
+        print(f"{_WARN}{text}{_RESET}")
 
     @staticmethod
     def info(text: str):
         """Print info message in blue"""
-        print(f"{Fore.CYAN}ℹ {text}{Style.RESET_ALL}")
+        print(f"{_INFO}{text}{_RESET}")
 
     @staticmethod
     def step(step_num: int, total: int, text: str):
         """Print a step in a process"""
-        print(f"{Fore.LIGHTBLACK_EX}[{step_num}/{total}]{Style.RESET_ALL} {text}", end="")
+        print(f"{_GRAY}[{step_num}/{total}]{_RESET} {text}", end="")
         sys.stdout.flush()
 
     @staticmethod
     def step_done(success: bool = True):
         """Mark the current step as done"""
-        if success:
-            print(f" {Fore.GREEN}✓{Style.RESET_ALL}")
-        else:
-            print(f" {Fore.RED}✗{Style.RESET_ALL}")
+        print(_STEP_OK if success else _STEP_FAIL)
 
     @staticmethod
     def date_header(date: str, date_num: int, total_dates: int):
         """Print a date being processed"""
-        print(f"\n{Fore.MAGENTA}{Style.BRIGHT}[{date_num}/{total_dates}] {date}{Style.RESET_ALL}")
+        print(f"{_DATE_HEADER}[{date_num}/{total_dates}] {date}{_RESET}")
 
     @staticmethod
     def booking_result(date: str, success: bool, desk_code: str = None):
         """Print booking result for a date"""
         if success:
             desk_info = f" ({desk_code})" if desk_code else ""
-            print(f"{Fore.GREEN}{Style.BRIGHT}✓ BOOKED{Style.RESET_ALL} {date}{Fore.GREEN}{desk_info}{Style.RESET_ALL}")
+            print(f"{_BOOKED}{date}{Fore.GREEN}{desk_info}{_RESET}")
         else:
-            print(f"{Fore.YELLOW}○ SKIPPED{Style.RESET_ALL} {date} {Fore.LIGHTBLACK_EX}(no available desks){Style.RESET_ALL}")
+            print(f"{_SKIPPED}{date}{_NO_DESKS}")
 
     @staticmethod
     def summary_table(results: dict, existing_bookings: list = None):
@@ -97,95 +152,66 @@ class PrettyOutput:
         booked = [date for date, success in results.items() if success]
         skipped = [date for date, success in results.items() if not success]
 
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}{'SUMMARY':^70}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'─' * 70}{Style.RESET_ALL}")
+        # Build the whole table first and emit it with one write
+        parts = [_SUMMARY_TITLE, _SUMMARY_RULE]
 
         if existing_bookings:
-            print(f"{Fore.GREEN}Already Booked:{Style.RESET_ALL} {len(existing_bookings)} dates")
-            for date in sorted(existing_bookings):
-                print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {date}")
-            print()
+            parts.append(f"{_ALREADY_BOOKED}{len(existing_bookings)} dates")
+            parts.extend(f"{_DATE_OK}{date}" for date in sorted(existing_bookings))
+            parts.append("")
 
         if booked:
-            print(f"{Fore.GREEN}Newly Booked:{Style.RESET_ALL} {len(booked)} dates")
-            for date in sorted(booked):
-                print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {date}")
+            parts.append(f"{_NEWLY_BOOKED}{len(booked)} dates")
+            parts.extend(f"{_DATE_OK}{date}" for date in sorted(booked))
         else:
-            print(f"{Fore.YELLOW}Newly Booked:{Style.RESET_ALL} 0 dates")
+            parts.append(_NONE_BOOKED)
 
         if skipped:
-            print(f"\n{Fore.YELLOW}Skipped:{Style.RESET_ALL} {len(skipped)} dates {Fore.LIGHTBLACK_EX}(no seats available){Style.RESET_ALL}")
-            for date in sorted(skipped):
-                print(f"  {Fore.LIGHTBLACK_EX}○ {date}{Style.RESET_ALL}")
+            parts.append(f"{_SKIPPED_TITLE}{len(skipped)}{_NO_SEATS}")
+            parts.extend(f"{_DATE_SKIPPED}{date}{_RESET}" for date in sorted(skipped))
 
-        print(f"{Fore.CYAN}{'─' * 70}{Style.RESET_ALL}\n")
+        parts.append(_SUMMARY_RULE + "\n")
+        _emit(("\n".join(parts), "\n"))
 
     @staticmethod
     def round_header(round_num: int, dates_count: int, existing_count: int = 0):
         """Print round header for continuous loop mode"""
-        print(f"\n{Fore.MAGENTA}{Style.BRIGHT}{'=' * 70}")
-        print(f"ROUND {round_num}".center(70))
-        print(f"{'=' * 70}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Trying {dates_count} date(s)", end="")
-        if existing_count > 0:
-            print(f" • Skipping {existing_count} already booked", end="")
-        print(f"{Style.RESET_ALL}\n")
+        skipping = f" • Skipping {existing_count} already booked" if existing_count > 0 else ""
+        _emit((
+            f"{_ROUND_TOP}\n",
+            f"ROUND {round_num}".center(70), "\n",
+            f"{_ROUND_BOTTOM}\n",
+            f"{_ROUND_TRYING}{dates_count} date(s){skipping}{_RESET}\n\n",
+        ))
 
     @staticmethod
     def waiting(seconds: int, reason: str = "No seats available"):
         """Print waiting message"""
-        print(f"\n{Fore.YELLOW}⏳ {reason} • Waiting {seconds}s before retry...{Style.RESET_ALL}")
+        print(f"{_WAITING}{reason} • Waiting {seconds}s before retry...{_RESET}")
 
     @staticmethod
     def mode_banner(mode: str):
         """Print mode banner"""
-        banners = {
-            "headless": (
-                f"{Fore.BLUE}{Style.BRIGHT}HEADLESS MODE{Style.RESET_ALL}",
-                f"{Fore.LIGHTBLACK_EX}Background operation • Checks existing bookings • Continuous loop • Ctrl+C to stop{Style.RESET_ALL}"
-            ),
-            "loop": (
-                f"{Fore.MAGENTA}{Style.BRIGHT}CONTINUOUS LOOP MODE{Style.RESET_ALL}",
-                f"{Fore.YELLOW}Keeps trying all dates forever • Press Ctrl+C to stop{Style.RESET_ALL}"
-            ),
-            "poll": (
-                f"{Fore.CYAN}{Style.BRIGHT}POLLING MODE{Style.RESET_ALL}",
-                f"{Fore.YELLOW}Keeps trying until at least one booking succeeds{Style.RESET_ALL}"
-            )
-        }
-
-        if mode in banners:
-            title, desc = banners[mode]
-            print(f"\n{Fore.CYAN}{'─' * 70}{Style.RESET_ALL}")
-            print(f"{title}")
-            print(f"{desc}")
-            print(f"{Fore.CYAN}{'─' * 70}{Style.RESET_ALL}\n")
+        if mode in _MODE_BANNERS:
+            title, desc = _MODE_BANNERS[mode]
+            _emit(("\n", _SUMMARY_RULE, "\n", title, "\n", desc, "\n", _SUMMARY_RULE, "\n\n"))
 
     @staticmethod
     def progress_inline(text: str):
         """Print inline progress (same line, no newline)"""
-        print(f"\r{Fore.LIGHTBLACK_EX}{text}{Style.RESET_ALL}", end="")
+        print(f"{_PROGRESS}{text}{_RESET}", end="")
         sys.stdout.flush()
 
     @staticmethod
     def clear_line():
         """Clear the current line"""
-        print("\r" + " " * 80 + "\r", end="")
+        print(_CLEAR_LINE, end="")
         sys.stdout.flush()
 
 
-# Convenience functions
-def header(text: str, char: str = "="):
-    PrettyOutput.header(text, char)
-
-def success(text: str):
-    PrettyOutput.success(text)
-
-def error(text: str):
-    PrettyOutput.error(text)
-
-def warning(text: str):
-    PrettyOutput.warning(text)
-
-def info(text: str):
-    PrettyOutput.info(text)
+# Convenience functions (aliases of the static methods, no extra call layer)
+header = PrettyOutput.header
+success = PrettyOutput.success
+error = PrettyOutput.error
+warning = PrettyOutput.warning
+info = PrettyOutput.info
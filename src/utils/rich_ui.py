@@ -5,29 +5,71 @@ Beautiful terminal interface with panels, progress bars, and live updates.
 Inspired by CyberDropDownloader's clean UI design.
 """
 
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
+from collections import Counter, deque
+from array import array
 from datetime import datetime
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.layout import Layout
-from rich.live import Live
 from rich.table import Table
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
 from rich.text import Text
 from rich.align import Align
 from rich import box
-from enum import Enum
+from enum import IntEnum
+import bisect
+import math
 import time
 
 
-class DateStatus(Enum):
-    """Status of a booking date"""
-    PENDING = "pending"
-    TRYING = "trying"
-    SUCCESS = "success"
-    SKIPPED = "skipped"
-    ALREADY_BOOKED = "already_booked"
-    FAILED = "failed"
+class DateStatus(IntEnum):
+    """Status of a booking date (int-valued so comparisons/hashing are plain int ops)"""
+    # Dates still to be booked come first (all < SUCCESS)
+    PENDING = 0
+    TRYING = 1
+    SKIPPED = 2
+    SUCCESS = 3
+    ALREADY_BOOKED = 4
+    FAILED = 5
+
+
+# Icon and status cells for the dates panel, built once and reused every refresh
+_STATUS_CELLS: Dict[DateStatus, Tuple[Text, Text]] = {
+    DateStatus.SUCCESS: (Text.from_markup("[green][+][/green]"), Text.from_markup("[green]BOOKED[/green]")),
+    DateStatus.ALREADY_BOOKED: (Text.from_markup("[cyan][=][/cyan]"), Text.from_markup("[cyan]ALREADY BOOKED[/cyan]")),
+    DateStatus.TRYING: (Text.from_markup("[yellow][>][/yellow]"), Text.from_markup("[yellow]TRYING[/yellow]")),
+    DateStatus.SKIPPED: (Text.from_markup("[yellow][-][/yellow]"), Text.from_markup("[yellow]NO SEATS[/yellow]")),
+    DateStatus.FAILED: (Text.from_markup("[red][!][/red]"), Text.from_markup("[red]FAILED[/red]")),
+    DateStatus.PENDING: (Text.from_markup("[dim][ ][/dim]"), Text.from_markup("[dim]PENDING[/dim]")),
+}
+
+
+# Booking statistics live in an int array: one slot per result status, then the total
+_STATS_FIELDS = ("completed", "already_booked", "skipped", "failed", "total")
+_STATS_INDEX = {
+    DateStatus.SUCCESS: 0,
+    DateStatus.ALREADY_BOOKED: 1,
+    DateStatus.SKIPPED: 2,
+    DateStatus.FAILED: 3,
+}
+_STATS_TOTAL = 4
+
+# (stats index, label, color) rows of the statistics panel
+_STATS_ROWS = (
+    (_STATS_INDEX[DateStatus.SUCCESS], "Completed", "green"),
+    (_STATS_INDEX[DateStatus.ALREADY_BOOKED], "Already Booked", "cyan"),
+    (_STATS_INDEX[DateStatus.SKIPPED], "No Seats Available", "yellow"),
+    (_STATS_INDEX[DateStatus.FAILED], "Failed", "red"),
+)
+
+# Title and border color of each dashboard panel
+_PANEL_CHROME = {
+    "dates": ("[bold cyan]Booking Dates Status[/bold cyan]", "cyan"),
+    "stats": ("[bold cyan]Booking Statistics[/bold cyan]", "cyan"),
+    "op": ("[bold yellow]Current Activity[/bold yellow]", "yellow"),
+    "log": ("[bold blue]Activity Log[/bold blue]", "blue"),
+    "session": ("[bold magenta]Session Info[/bold magenta]", "magenta"),
+    "summary": ("[bold green]Quick Summary[/bold green]", "green"),
+}
 
 
 class RichUI:
@@ -41,15 +83,18 @@ class RichUI:
     - Clean, organized layout
     """
 
+    # Dashboard panels: (dirty key, layout slot, panel builder)
+    _PANEL_SLOTS = (
+        ("dates", "left", "get_dates_status_panel"),
+        ("session", "session_info", "get_round_info_panel"),
+        ("summary", "summary", "get_summary_panel"),
+        ("op", "current_op", "get_current_operation_panel"),
+        ("log", "footer", "get_activity_log_panel"),
+    )
+
     def __init__(self):
         self.console = Console(force_terminal=True, legacy_windows=False)
-        self.stats = {
-            "completed": 0,
-            "already_booked": 0,
-            "skipped": 0,
-            "failed": 0,
-            "total": 0
-        }
+        self._stats = array('i', [0] * len(_STATS_FIELDS))  # Indexed per _STATS_FIELDS
         self.current_round = 1
         self.dates_tried = []
         self.successful_bookings = []
@@ -63,19 +108,70 @@ class RichUI:
         self.date_statuses: Dict[str, DateStatus] = {}
         self.date_desks: Dict[str, str] = {}  # Maps date -> desk code
         self.date_attempts: Dict[str, int] = {}  # Maps date -> attempt count
+        self._sorted_dates: List[str] = []  # date_statuses keys, kept in chronological order
+        self._sorted_statuses: List[DateStatus] = []  # Parallel to _sorted_dates, for hash-free panel loops
+        self._status_counts: Counter = Counter()  # DateStatus -> number of dates in it
+        self._row_cells: Dict[str, tuple] = {}  # date -> (row state, cells) from the last dates panel
 
         # Live dashboard
         self.live_dashboard = None
         self.layout = None
 
         # Activity log for detailed operations
-        self.activity_log: List[str] = []
         self.max_activity_log = 15  # Keep last 15 activity messages
+        self.activity_log: Deque[str] = deque(maxlen=self.max_activity_log)
 
-        # Countdown timer
-        self.countdown_seconds = 0
+        # Countdown timer (remaining time is derived from the deadline)
+        self._countdown_deadline: Optional[float] = None
+        self._countdown_shown = 0  # Value in the current-operation panel
         self.countdown_message = ""
 
+        # Panels whose inputs changed since they were last rendered
+        self._dirty = {key: True for key, _, _ in self._PANEL_SLOTS}
+        self._session_key = None  # (runtime second, round) shown in Session Info
+        self._last_runtime_sec = -1
+        self._panels: Dict[str, Panel] = {}  # Reused Panel per key, see _panel()
+        self._stats_key: Optional[tuple] = None  # Stats values shown in the cached stats panel
+        self._last_runtime_str = ""
+
+    def _mark_dirty(self, *keys: str):
+        """Flag panels for rebuild and refresh the live layout"""
+        for key in keys:
+            self._dirty[key] = True
+        if self.live_dashboard:
+            self.update_layout()
+
+    def _current_session_key(self):
+        """Inputs of the Session Info panel that change without a mutator call"""
+        return int(time.time() - self.start_time), self.current_round
+
+    @property
+    def countdown_seconds(self) -> int:
+        """Whole seconds left on the countdown (0 when none is running)"""
+        if self._countdown_deadline is None:
+            return 0
+        return max(0, math.ceil(self._countdown_deadline - time.monotonic()))
+
+    def _panel(self, key: str, content) -> Panel:
+        """Return the panel for key with new content; title and border are built only once"""
+        panel = self._panels.get(key)
+        if panel is None:
+            title, border_style = _PANEL_CHROME[key]
+            panel = self._panels[key] = Panel(
+                content,
+                title=Text.from_markup(title),
+                border_style=border_style,
+                box=box.ROUNDED
+            )
+        else:
+            panel.renderable = content
+        return panel
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the booking statistics by name (use update_stats to change them)"""
+        return dict(zip(_STATS_FIELDS, self._stats))
+
     def clear(self):
         """Clear the console"""
         self.console.clear()
@@ -93,101 +189,75 @@ class RichUI:
             table.add_column(justify="left", width=20)
             table.add_column(justify="left", style="dim")
 
-            # Sort dates chronologically
-            sorted_dates = sorted(self.date_statuses.keys())
-
-            for date in sorted_dates:
-                status = self.date_statuses[date]
-                desk = self.date_desks.get(date, "")
-                attempts = self.date_attempts.get(date, 0)
-
-                # Status icon and color
+            # Dates are kept sorted chronologically as they are added
+            row_cache = self._row_cells
+            for date, status in zip(self._sorted_dates, self._sorted_statuses):
+                # Only the detail column depends on per-date data
                 if status == DateStatus.SUCCESS:
-                    icon = "[green][+][/green]"
-                    status_text = f"[green]BOOKED[/green]"
-                    detail = f"[green]{desk}[/green]" if desk else ""
-                elif status == DateStatus.ALREADY_BOOKED:
-                    icon = "[cyan][=][/cyan]"
-                    status_text = f"[cyan]ALREADY BOOKED[/cyan]"
-                    detail = ""
+                    state = (status, self.date_desks.get(date, ""))
                 elif status == DateStatus.TRYING:
-                    icon = "[yellow][>][/yellow]"
-                    status_text = f"[yellow]TRYING[/yellow]"
-                    detail = f"[dim]attempt {attempts}[/dim]" if attempts > 0 else ""
-                elif status == DateStatus.SKIPPED:
-                    icon = "[yellow][-][/yellow]"
-                    status_text = f"[yellow]NO SEATS[/yellow]"
-                    detail = ""
-                elif status == DateStatus.FAILED:
-                    icon = "[red][!][/red]"
-                    status_text = f"[red]FAILED[/red]"
-                    detail = ""
-                else:  # PENDING
-                    icon = "[dim][ ][/dim]"
-                    status_text = f"[dim]PENDING[/dim]"
-                    detail = ""
-
-                table.add_row(f"{icon} {date}", status_text, detail)
+                    state = (status, self.date_attempts.get(date, 0))
+                else:
+                    state = (status, None)
+
+                # Rows whose inputs didn't change reuse their cells from the last rebuild
+                cached = row_cache.get(date)
+                if cached is not None and cached[0] == state:
+                    cells = cached[1]
+                else:
+                    cells = self._build_date_row(date, state)
+                    row_cache[date] = (state, cells)
+
+                table.add_row(*cells)
 
             content = table
 
-        return Panel(
-            content,
-            title="[bold cyan]Booking Dates Status[/bold cyan]",
-            border_style="cyan",
-            box=box.ROUNDED
-        )
+        return self._panel("dates", content)
+
+    @staticmethod
+    def _build_date_row(date: str, state: tuple) -> tuple:
+        """Cells (icon + date, status, detail) for one row of the dates panel"""
+        status, extra = state
+        icon, status_text = _STATUS_CELLS.get(status, _STATUS_CELLS[DateStatus.PENDING])
+
+        detail = ""
+        if status == DateStatus.SUCCESS and extra:
+            detail = Text.assemble((extra, "green"))
+        elif status == DateStatus.TRYING and extra > 0:
+            detail = Text.assemble((f"attempt {extra}", "dim"))
+
+        return icon + f" {date}", status_text, detail
 
     def get_stats_panel(self) -> Panel:
         """
         Create a statistics panel showing booking results.
         Similar to the 'Files' panel in CyberDropDownloader.
         """
+        # Unchanged stats: the cached panel still shows the right numbers
+        key = tuple(self._stats)
+        if key == self._stats_key:
+            return self._panels["stats"]
+        self._stats_key = key
+
         table = Table.grid(padding=(0, 2))
         table.add_column(style="bold", justify="left")
         table.add_column(justify="right", style="bold")
         table.add_column(justify="right")
 
-        total = self.stats["total"] if self.stats["total"] > 0 else 1
-
-        # Completed bookings (green)
-        completed_pct = (self.stats["completed"] / total) * 100
-        table.add_row(
-            "[green]Completed[/green]",
-            f"[green]{completed_pct:.1f}%[/green]",
-            f"[dim]{self.stats['completed']} of {self.stats['total']} Dates[/dim]"
-        )
+        stats = self._stats
+        count_total = stats[_STATS_TOTAL]
+        total = count_total if count_total > 0 else 1
 
-        # Already booked (cyan)
-        already_pct = (self.stats["already_booked"] / total) * 100
-        table.add_row(
-            "[cyan]Already Booked[/cyan]",
-            f"[cyan]{already_pct:.1f}%[/cyan]",
-            f"[dim]{self.stats['already_booked']} of {self.stats['total']} Dates[/dim]"
-        )
-
-        # Skipped (yellow)
-        skipped_pct = (self.stats["skipped"] / total) * 100
-        table.add_row(
-            "[yellow]No Seats Available[/yellow]",
-            f"[yellow]{skipped_pct:.1f}%[/yellow]",
-            f"[dim]{self.stats['skipped']} of {self.stats['total']} Dates[/dim]"
-        )
-
-        # Failed (red)
-        failed_pct = (self.stats["failed"] / total) * 100
-        table.add_row(
-            "[red]Failed[/red]",
-            f"[red]{failed_pct:.1f}%[/red]",
-            f"[dim]{self.stats['failed']} of {self.stats['total']} Dates[/dim]"
-        )
+        for index, label, color in _STATS_ROWS:
+            count = stats[index]
+            pct = (count / total) * 100
+            table.add_row(
+                f"[{color}]{label}[/{color}]",
+                f"[{color}]{pct:.1f}%[/{color}]",
+                f"[dim]{count} of {count_total} Dates[/dim]"
+            )
 
-        return Panel(
-            table,
-            title="[bold cyan]Booking Statistics[/bold cyan]",
-            border_style="cyan",
-            box=box.ROUNDED
-        )
+        return self._panel("stats", table)
 
     def get_current_operation_panel(self) -> Panel:
         """
@@ -200,26 +270,21 @@ class RichUI:
             lines.append(Text("> ", style="yellow bold") + Text(self.current_operation, style="white"))
 
         if self.current_step:
-            lines.append(Text("  ", style="dim") + Text(self.current_step, style="dim"))
+            lines.append(Text.from_markup("[dim]  [/dim]") + Text(self.current_step, style="dim"))
 
         # Show countdown if active
-        if self.countdown_seconds > 0:
-            mins = self.countdown_seconds // 60
-            secs = self.countdown_seconds % 60
+        remaining = self._countdown_shown = self.countdown_seconds
+        if remaining > 0:
+            mins, secs = divmod(remaining, 60)
             countdown_text = f"{mins:02d}:{secs:02d}"
             lines.append(Text(f"\n  Countdown: ", style="dim") + Text(countdown_text, style="yellow bold"))
 
         if not lines:
             content = Text("Idle...", style="dim")
         else:
-            content = Text("\n").join(lines)
+            content = Group(*lines)
 
-        return Panel(
-            Align.left(content),
-            title="[bold yellow]Current Activity[/bold yellow]",
-            border_style="yellow",
-            box=box.ROUNDED
-        )
+        return self._panel("op", Align.left(content))
 
     def get_activity_log_panel(self) -> Panel:
         """
@@ -229,21 +294,11 @@ class RichUI:
         if not self.activity_log:
             content = Text("No activity yet...", style="dim")
         else:
-            # Show last entries (most recent at bottom)
-            recent_logs = self.activity_log[-self.max_activity_log:]
-            log_lines = []
-            for log in recent_logs:
-                # Add timestamp-style prefix
-                log_lines.append(Text(log, style="dim"))
-
-            content = Text("\n").join(log_lines)
-
-        return Panel(
-            Align.left(content),
-            title="[bold blue]Activity Log[/bold blue]",
-            border_style="blue",
-            box=box.ROUNDED
-        )
+            # Show last entries (most recent at bottom); the deque holds at most max_activity_log
+            # Group renders the lines one by one, no merged Text needed
+            content = Group(*[Text(log, style="dim") for log in self.activity_log])
+
+        return self._panel("log", Align.left(content))
 
     def get_round_info_panel(self) -> Panel:
         """
@@ -253,15 +308,17 @@ class RichUI:
         table.add_column(style="bold cyan", justify="left")
         table.add_column(justify="left", style="white")
 
-        # Runtime
-        runtime = time.time() - self.start_time
-        hours = int(runtime // 3600)
-        minutes = int((runtime % 3600) // 60)
-        seconds = int(runtime % 60)
-        runtime_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-        # Calculate pending/trying dates
-        pending = sum(1 for s in self.date_statuses.values() if s in [DateStatus.PENDING, DateStatus.TRYING, DateStatus.SKIPPED])
+        # Runtime (the string only changes once per second)
+        runtime_sec = int(time.time() - self.start_time)
+        if runtime_sec != self._last_runtime_sec:
+            minutes, seconds = divmod(runtime_sec, 60)
+            hours, minutes = divmod(minutes, 60)
+            self._last_runtime_sec = runtime_sec
+            self._last_runtime_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        runtime_str = self._last_runtime_str
+
+        # Calculate pending/trying/skipped dates (every status below SUCCESS)
+        pending = sum(n for status, n in self._status_counts.items() if status < DateStatus.SUCCESS)
         total = len(self.date_statuses)
 
         table.add_row("Round:", f"#{self.current_round}")
@@ -277,23 +334,19 @@ class RichUI:
             next_wait = "15 min"
         table.add_row("Next Check:", next_wait)
 
-        return Panel(
-            table,
-            title="[bold magenta]Session Info[/bold magenta]",
-            border_style="magenta",
-            box=box.ROUNDED
-        )
+        return self._panel("session", table)
 
     def get_summary_panel(self) -> Panel:
         """
         Create a quick summary panel showing key metrics.
         """
-        # Count statuses
-        success_count = sum(1 for s in self.date_statuses.values() if s == DateStatus.SUCCESS)
-        already_count = sum(1 for s in self.date_statuses.values() if s == DateStatus.ALREADY_BOOKED)
-        skipped_count = sum(1 for s in self.date_statuses.values() if s == DateStatus.SKIPPED)
-        trying_count = sum(1 for s in self.date_statuses.values() if s == DateStatus.TRYING)
-        pending_count = sum(1 for s in self.date_statuses.values() if s == DateStatus.PENDING)
+        # Status counts are maintained by set_date_status/initialize_dates
+        counts = self._status_counts
+        success_count = counts[DateStatus.SUCCESS]
+        already_count = counts[DateStatus.ALREADY_BOOKED]
+        skipped_count = counts[DateStatus.SKIPPED]
+        trying_count = counts[DateStatus.TRYING]
+        pending_count = counts[DateStatus.PENDING]
 
         table = Table.grid(padding=(0, 2))
         table.add_column(style="bold", justify="left")
@@ -315,14 +368,9 @@ class RichUI:
         else:
             content = table
 
-        return Panel(
-            content,
-            title="[bold green]Quick Summary[/bold green]",
-            border_style="green",
-            box=box.ROUNDED
-        )
+        return self._panel("summary", content)
 
-    def create_layout(self) -> Layout:
+    def create_layout(self) -> "Layout":
         """
         Create the main layout with all panels.
 
@@ -339,6 +387,8 @@ class RichUI:
         |      Activity Log (full width)     |
         +------------------+------------------+
         """
+        from rich.layout import Layout  # Deferred: only needed for the live dashboard
+
         layout = Layout()
 
         # Create header
@@ -373,36 +423,47 @@ class RichUI:
         )
 
         # Update panels
-        layout["left"].update(self.get_dates_status_panel())
-        layout["session_info"].update(self.get_round_info_panel())
-        layout["summary"].update(self.get_summary_panel())
-        layout["current_op"].update(self.get_current_operation_panel())
-        layout["footer"].update(self.get_activity_log_panel())
+        for key, slot, builder in self._PANEL_SLOTS:
+            layout[slot].update(getattr(self, builder)())
+            self._dirty[key] = False
+        self._session_key = self._current_session_key()
 
         return layout
 
     def update_layout(self):
-        """Update all panels in the layout"""
+        """Rebuild only the panels whose inputs changed since the last update"""
         if self.layout:
-            self.layout["left"].update(self.get_dates_status_panel())
-            self.layout["session_info"].update(self.get_round_info_panel())
-            self.layout["summary"].update(self.get_summary_panel())
-            self.layout["current_op"].update(self.get_current_operation_panel())
-            self.layout["footer"].update(self.get_activity_log_panel())
+            # Runtime and round are read directly, so compare them instead of a flag
+            session_key = self._current_session_key()
+            if session_key != self._session_key:
+                self._dirty["session"] = True
+                self._session_key = session_key
+
+            changed = False
+            for key, slot, builder in self._PANEL_SLOTS:
+                if self._dirty[key]:
+                    self.layout[slot].update(getattr(self, builder)())
+                    self._dirty[key] = False
+                    changed = True
+
+            # The dashboard doesn't auto-refresh; repaint only when a panel changed
+            if changed and self.live_dashboard:
+                self.live_dashboard.refresh()
 
     def update_stats(self, completed: int = None, already_booked: int = None,
                     skipped: int = None, failed: int = None, total: int = None):
         """Update statistics"""
+        stats = self._stats
         if completed is not None:
-            self.stats["completed"] = completed
+            stats[_STATS_INDEX[DateStatus.SUCCESS]] = completed
         if already_booked is not None:
-            self.stats["already_booked"] = already_booked
+            stats[_STATS_INDEX[DateStatus.ALREADY_BOOKED]] = already_booked
         if skipped is not None:
-            self.stats["skipped"] = skipped
+            stats[_STATS_INDEX[DateStatus.SKIPPED]] = skipped
         if failed is not None:
-            self.stats["failed"] = failed
+            stats[_STATS_INDEX[DateStatus.FAILED]] = failed
         if total is not None:
-            self.stats["total"] = total
+            stats[_STATS_TOTAL] = total
 
     def set_operation(self, operation: str, step: str = ""):
         """Set the current operation text"""
@@ -417,49 +478,49 @@ class RichUI:
             else:
                 self.log_activity(f"[{timestamp}] {operation}")
 
-        if self.live_dashboard:
-            self.update_layout()
+        self._mark_dirty("op")
 
     def log_activity(self, message: str):
         """Add a message to the activity log"""
-        self.activity_log.append(message)
-        # Keep only last N messages
-        if len(self.activity_log) > self.max_activity_log:
-            self.activity_log = self.activity_log[-self.max_activity_log:]
-        if self.live_dashboard:
-            self.update_layout()
+        self.activity_log.append(message)  # deque drops the oldest beyond max_activity_log
+        self._mark_dirty("log")
 
     def start_countdown(self, seconds: int, message: str = ""):
         """Start a countdown timer"""
-        self.countdown_seconds = seconds
+        self._countdown_deadline = time.monotonic() + seconds
         self.countdown_message = message
-        if self.live_dashboard:
-            self.update_layout()
+        self._mark_dirty("op")
 
     def update_countdown(self):
-        """Decrement countdown by 1 second"""
-        if self.countdown_seconds > 0:
-            self.countdown_seconds -= 1
-            if self.live_dashboard:
-                self.update_layout()
-        return self.countdown_seconds
+        """Refresh the countdown display from the clock; a late caller doesn't cause drift"""
+        remaining = self.countdown_seconds
+        if remaining != self._countdown_shown:
+            self._mark_dirty("op")
+        return remaining
 
     def stop_countdown(self):
         """Stop the countdown timer"""
-        self.countdown_seconds = 0
+        self._countdown_deadline = None
         self.countdown_message = ""
-        if self.live_dashboard:
-            self.update_layout()
+        self._mark_dirty("op")
 
     def set_date_status(self, date: str, status: DateStatus, desk: str = None, attempt: int = None):
         """Update the status of a specific date"""
+        old_status = self.date_statuses.get(date)
+        idx = bisect.bisect_left(self._sorted_dates, date)
+        if old_status is None:
+            self._sorted_dates.insert(idx, date)
+            self._sorted_statuses.insert(idx, status)
+        else:
+            self._status_counts[old_status] -= 1
+            self._sorted_statuses[idx] = status
         self.date_statuses[date] = status
+        self._status_counts[status] += 1
         if desk:
             self.date_desks[date] = desk
         if attempt is not None:
             self.date_attempts[date] = attempt
-        if self.live_dashboard:
-            self.update_layout()
+        self._mark_dirty("dates", "summary", "session")
 
     def initialize_dates(self, dates: List[str], existing_bookings: List[str] = None):
         """Initialize all dates with pending status"""
@@ -469,24 +530,29 @@ class RichUI:
             else:
                 self.date_statuses[date] = DateStatus.PENDING
             self.date_attempts[date] = 0
+        self._sorted_dates = sorted(self.date_statuses)
+        self._sorted_statuses = [self.date_statuses[date] for date in self._sorted_dates]
+        self._status_counts = Counter(self.date_statuses.values())
 
-        self.stats["total"] = len(dates)
-        self.stats["already_booked"] = len(existing_bookings) if existing_bookings else 0
+        self._stats[_STATS_TOTAL] = len(dates)
+        self._stats[_STATS_INDEX[DateStatus.ALREADY_BOOKED]] = len(existing_bookings) if existing_bookings else 0
 
-        if self.live_dashboard:
-            self.update_layout()
+        self._mark_dirty("dates", "summary", "session")
 
     def start_live_dashboard(self):
         """Start the live dashboard"""
+        from rich.live import Live  # Deferred: only needed for the live dashboard
+
         self.layout = self.create_layout()
         self.live_dashboard = Live(
             self.layout,
             console=self.console,
-            refresh_per_second=1,  # 1 FPS - perfect for countdown, minimal flickering
+            auto_refresh=False,  # Repainted by update_layout when a panel changes; idle = no output
+            refresh_per_second=4,
             screen=False,
             transient=False
         )
-        self.live_dashboard.start()
+        self.live_dashboard.start(refresh=True)
         return self.live_dashboard
 
     def stop_live_dashboard(self):
@@ -622,8 +688,10 @@ class RichUI:
         self.console.print(table)
         self.console.print()
 
-    def create_progress(self) -> Progress:
+    def create_progress(self) -> "Progress":
         """Create a progress bar for operations"""
+        from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
@@ -634,5 +702,14 @@ class RichUI:
         )
 
 
-# Global instance for easy access
-ui = RichUI()
+# Global instance for easy access, created on first access of ``ui`` (PEP 562)
+_ui: Optional[RichUI] = None
+
+
+def __getattr__(name: str):
+    global _ui
+    if name == "ui":
+        if _ui is None:
+            _ui = RichUI()
+        return _ui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
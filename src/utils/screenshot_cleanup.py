@@ -4,13 +4,69 @@ Screenshot Cleanup Utility
 Automatically cleans up old screenshots, keeping only the current and previous session.
 """
 
+import heapq
+import os
 import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Set
+from typing import Optional
 import logging
 
+# Pattern to extract session timestamp from filename
+# Examples: floor_map_loaded_20251026_214620.png, booking_success_2025-11-19_20251026_213957.png
+_TIMESTAMP_RE = re.compile(r'(\d{8}_\d{6})')
+
+# Shared pool for async_mode deletes (created on first use)
+_delete_executor: Optional[ThreadPoolExecutor] = None
+_delete_executor_lock = threading.Lock()
+
+
+def _get_delete_executor() -> ThreadPoolExecutor:
+    global _delete_executor
+    if _delete_executor is None:
+        with _delete_executor_lock:
+            if _delete_executor is None:
+                _delete_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ScreenshotCleanup")
+    return _delete_executor
+
+
+def _delete_screenshot(path: str, logger=None) -> bool:
+    """Delete one screenshot; returns True if it is gone afterwards"""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        # Already removed (e.g. by a concurrent cleanup) - same end result
+        return True
+    except Exception as e:
+        msg = f"Failed to delete {os.path.basename(path)}: {e}"
+        # Verbose output suppressed
+        # print(f"[CLEANUP] {msg}")
+        if logger:
+            logger.warning(msg)
+    return False
+
+
+def _log_cleanup_summary(logger, deleted_count: int, kept_count: int,
+                         sessions_to_keep: set, sessions_to_delete: set, manual_count: int):
+    """Log the result of a cleanup run"""
+    msg = f"Deleted {deleted_count} old screenshot(s) from {len(sessions_to_delete)} session(s), kept {kept_count} from {len(sessions_to_keep)} recent session(s)"
+    # Verbose output suppressed
+    # print(f"[CLEANUP] {msg}")
+    if logger:
+        logger.info(msg)
+
+    # Log details
+    if logger:
+        logger.info(f"Sessions kept: {sorted(sessions_to_keep, reverse=True)}")
+        logger.info(f"Sessions deleted: {sorted(sessions_to_delete, reverse=True)}")
+        logger.info(f"Manual screenshots preserved: {manual_count}")
+
 
-def cleanup_old_screenshots(screenshots_dir: Path = None, keep_sessions: int = None, logger=None):
+def cleanup_old_screenshots(screenshots_dir: Path = None, keep_sessions: int = None, logger=None,
+                            async_mode: bool = False):
     """
     Clean up old screenshots, keeping only the most recent sessions.
 
@@ -18,6 +74,8 @@ def cleanup_old_screenshots(screenshots_dir: Path = None, keep_sessions: int = N
         screenshots_dir: Directory containing screenshots (default: ./screenshots)
         keep_sessions: Number of recent sessions to keep (default: from Config.SCREENSHOT_RETENTION)
         logger: Optional logger instance
+        async_mode: Delete on a background thread pool and return immediately;
+            the summary is logged once all deletes finish
     """
     from config import Config
 
@@ -30,27 +88,28 @@ def cleanup_old_screenshots(screenshots_dir: Path = None, keep_sessions: int = N
     if not screenshots_dir.exists():
         return
 
-    # Pattern to extract session timestamp from filename
-    # Examples: floor_map_loaded_20251026_214620.png, booking_success_2025-11-19_20251026_213957.png
-    timestamp_pattern = re.compile(r'(\d{8}_\d{6})')
+    # Group automated screenshots by session timestamp in a single directory pass
+    # (exclude manual screenshots like "Screenshot 2025-10-27...")
+    sessions = defaultdict(list)
+    manual_count = 0
 
-    # Find all automated screenshots (exclude manual screenshots like "Screenshot 2025-10-27...")
-    automated_screenshots = []
-    manual_screenshots = []
+    with os.scandir(screenshots_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".png"):
+                continue
 
-    for file in screenshots_dir.glob("*.png"):
-        # Skip manual screenshots (ones that start with "Screenshot ")
-        if file.name.startswith("Screenshot "):
-            manual_screenshots.append(file)
-            continue
+            # Skip manual screenshots (ones that start with "Screenshot ")
+            if name.startswith("Screenshot "):
+                manual_count += 1
+                continue
 
-        # Extract timestamp from automated screenshots
-        match = timestamp_pattern.search(file.name)
-        if match:
-            timestamp = match.group(1)
-            automated_screenshots.append((timestamp, file))
+            # Extract timestamp from automated screenshots
+            match = _TIMESTAMP_RE.search(name)
+            if match:
+                sessions[match.group(1)].append(entry.path)
 
-    if not automated_screenshots:
+    if not sessions:
         msg = "No automated screenshots to clean up"
         # Verbose output suppressed
         # print(f"[CLEANUP] {msg}")
@@ -58,19 +117,9 @@ def cleanup_old_screenshots(screenshots_dir: Path = None, keep_sessions: int = N
             logger.info(msg)
         return
 
-    # Group screenshots by session timestamp
-    sessions = {}
-    for timestamp, file in automated_screenshots:
-        if timestamp not in sessions:
-            sessions[timestamp] = []
-        sessions[timestamp].append(file)
-
-    # Sort sessions by timestamp (most recent first)
-    sorted_sessions = sorted(sessions.keys(), reverse=True)
-
-    # Keep only the most recent N sessions
-    sessions_to_keep = set(sorted_sessions[:keep_sessions])
-    sessions_to_delete = set(sorted_sessions[keep_sessions:])
+    # Keep only the most recent N sessions (no full sort needed for a small N)
+    sessions_to_keep = set(heapq.nlargest(keep_sessions, sessions))
+    sessions_to_delete = set(sessions) - sessions_to_keep
 
     if not sessions_to_delete:
         msg = f"All screenshots are from recent sessions (keeping {len(sessions_to_keep)} session(s))"
@@ -80,33 +129,37 @@ def cleanup_old_screenshots(screenshots_dir: Path = None, keep_sessions: int = N
             logger.info(msg)
         return
 
+    kept_count = sum(len(sessions[ts]) for ts in sessions_to_keep)
+    doomed = [path for ts in sessions_to_delete for path in sessions[ts]]
+
+    if async_mode:
+        # Overlap deletes with the caller's next steps; the last finished delete logs the summary
+        executor = _get_delete_executor()
+        lock = threading.Lock()
+        progress = {"pending": len(doomed), "deleted": 0}
+
+        def _on_done(future):
+            with lock:
+                if future.result():
+                    progress["deleted"] += 1
+                progress["pending"] -= 1
+                finished = progress["pending"] == 0
+            if finished:
+                _log_cleanup_summary(logger, progress["deleted"], kept_count,
+                                     sessions_to_keep, sessions_to_delete, manual_count)
+
+        for path in doomed:
+            executor.submit(_delete_screenshot, path, logger).add_done_callback(_on_done)
+        return
+
     # Delete old screenshots
     deleted_count = 0
-    for session_timestamp in sessions_to_delete:
-        for file in sessions[session_timestamp]:
-            try:
-                file.unlink()
-                deleted_count += 1
-            except Exception as e:
-                msg = f"Failed to delete {file.name}: {e}"
-                # Verbose output suppressed
-                # print(f"[CLEANUP] {msg}")
-                if logger:
-                    logger.warning(msg)
+    for path in doomed:
+        deleted_count += _delete_screenshot(path, logger)
 
     # Summary
-    kept_count = sum(len(sessions[ts]) for ts in sessions_to_keep)
-    msg = f"Deleted {deleted_count} old screenshot(s) from {len(sessions_to_delete)} session(s), kept {kept_count} from {len(sessions_to_keep)} recent session(s)"
-    # Verbose output suppressed
-    # print(f"[CLEANUP] {msg}")
-    if logger:
-        logger.info(msg)
-
-    # Log details
-    if logger:
-        logger.info(f"Sessions kept: {sorted(sessions_to_keep, reverse=True)}")
-        logger.info(f"Sessions deleted: {sorted(sessions_to_delete, reverse=True)}")
-        logger.info(f"Manual screenshots preserved: {len(manual_screenshots)}")
+    _log_cleanup_summary(logger, deleted_count, kept_count,
+                         sessions_to_keep, sessions_to_delete, manual_count)
 
 
 if __name__ == "__main__":
@@ -6,8 +6,11 @@ It opens SpaceIQ and allows you to interact with it while capturing element info
 """
 
 import asyncio
+import gzip
+import signal
 import sys
 from pathlib import Path
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -17,6 +20,20 @@ from src.auth.session_manager import SessionManager
 import json
 from datetime import datetime
 
+# Serialize the DOM without script/style/svg bodies (runs in the page, one round trip).
+# Populated floor plans make the full HTML tens of MB, almost none of it useful for selectors.
+_TRIMMED_HTML_JS = """() => {
+    const clone = document.documentElement.cloneNode(true);
+    clone.querySelectorAll('script, style, svg').forEach(e => e.remove());
+    return clone.outerHTML;
+}"""
+
+
+def _write_gzip_text(path: Path, text: str):
+    """Write text gzip-compressed (level 1: fastest, still ~8x smaller for HTML)"""
+    with gzip.open(path, 'wt', encoding='utf-8', compresslevel=1) as f:
+        f.write(text)
+
 
 class SelectorInspector:
     """Interactive tool to capture selectors from SpaceIQ"""
@@ -68,11 +85,12 @@ class SelectorInspector:
             print("\n⏳ Waiting... (browser will stay open)")
             print("=" * 70 + "\n")
 
-            # Keep browser open
-            try:
-                await asyncio.sleep(3600)  # Wait for 1 hour or until interrupted
-            except KeyboardInterrupt:
+            # Keep browser open until interrupted (or the window is closed)
+            reason = await self._wait_for_interrupt(page)
+            if reason == "interrupted":
                 print("\n\n✅ Capture interrupted by user")
+            elif reason == "closed":
+                print("\n\n✅ Browser window closed")
 
             print("\n" + "=" * 70)
             print("Browser Session Information")
@@ -80,7 +98,7 @@ class SelectorInspector:
 
             # Capture page information
             current_url = page.url
-            page_title = await page.title()
+            page_title = "(page closed)" if page.is_closed() else await page.title()
 
             print(f"\nFinal URL: {current_url}")
             print(f"Page Title: {page_title}")
@@ -98,13 +116,13 @@ class SelectorInspector:
             print("\nI will use this to inspect the page and find the selectors.")
             print("\n(Press Ctrl+C when you're ready to close the browser)")
 
-            try:
-                await asyncio.sleep(3600)
-            except KeyboardInterrupt:
-                print("\n\n✅ Closing browser...")
+            if not page.is_closed():
+                if await self._wait_for_interrupt(page) == "interrupted":
+                    print("\n\n✅ Closing browser...")
 
-            # Save page snapshot for analysis
-            await self._save_page_snapshot(page)
+            # Save page snapshot for analysis (needs the page still open)
+            if not page.is_closed():
+                await self._save_page_snapshot(page)
 
             await self.session_manager.close()
 
@@ -113,34 +131,98 @@ class SelectorInspector:
             import traceback
             traceback.print_exc()
 
-    async def _save_page_snapshot(self, page: Page):
-        """Save page information for analysis"""
+    async def _wait_for_interrupt(self, page: Page, timeout: float = 3600) -> str:
+        """
+        Block until Ctrl+C is pressed or the browser window is closed
+
+        Args:
+            page: Inspected page; closing it (or its context) ends the wait
+            timeout: Give up after this many seconds (default: 1 hour)
+
+        Returns:
+            "interrupted", "closed" or "timeout"
+        """
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+        on_close = lambda _: done.set()
+        page.on("close", on_close)
+        page.context.on("close", on_close)
+
+        previous_handler = signal.getsignal(signal.SIGINT)
+        try:
+            loop.add_signal_handler(signal.SIGINT, done.set)
+            sigint_handled = True
+        except (NotImplementedError, RuntimeError):
+            # Windows event loops don't support signal handlers; Ctrl+C raises instead
+            sigint_handled = False
+
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            return "timeout"
+        except KeyboardInterrupt:
+            return "interrupted"
+        finally:
+            page.remove_listener("close", on_close)
+            page.context.remove_listener("close", on_close)
+            if sigint_handled:
+                loop.remove_signal_handler(signal.SIGINT)
+                signal.signal(signal.SIGINT, previous_handler)
+
+        return "closed" if page.is_closed() else "interrupted"
+
+    async def _save_page_snapshot(
+        self,
+        page: Page,
+        clip: Optional[dict] = None,
+        full_html: bool = False
+    ):
+        """
+        Save page information for analysis
+
+        Args:
+            page: Playwright page to capture
+            clip: Optional {"x", "y", "width", "height"} region to screenshot
+                  instead of the full page
+            full_html: If True, save the complete page HTML instead of the
+                       trimmed copy (no script/style/svg elements)
+        """
 
         snapshot_dir = Path("inspector_output")
         snapshot_dir.mkdir(exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Save screenshot
-        screenshot_path = snapshot_dir / f"page_screenshot_{timestamp}.png"
-        await page.screenshot(path=str(screenshot_path), full_page=True)
-        print(f"\n📸 Screenshot saved: {screenshot_path}")
+        screenshot_path = snapshot_dir / f"page_screenshot_{timestamp}.jpg"
+        html_path = snapshot_dir / f"page_html_{timestamp}.html.gz"
+        info_path = snapshot_dir / f"page_info_{timestamp}.json"
 
-        # Save page HTML
-        html_path = snapshot_dir / f"page_html_{timestamp}.html"
-        content = await page.content()
-        html_path.write_text(content, encoding='utf-8')
-        print(f"📄 HTML saved: {html_path}")
+        # Screenshot, HTML and title are independent - fetch them concurrently
+        _, content, title = await asyncio.gather(
+            page.screenshot(
+                path=str(screenshot_path),
+                full_page=clip is None,
+                clip=clip,
+                type='jpeg',
+                quality=85,
+            ),
+            page.content() if full_html else page.evaluate(_TRIMMED_HTML_JS),
+            page.title(),
+        )
+        print(f"\n📸 Screenshot saved: {screenshot_path}")
 
-        # Save page info
         info = {
             "url": page.url,
-            "title": await page.title(),
+            "title": title,
             "timestamp": timestamp,
         }
 
-        info_path = snapshot_dir / f"page_info_{timestamp}.json"
-        info_path.write_text(json.dumps(info, indent=2))
+        # Write files off the event loop
+        await asyncio.gather(
+            asyncio.to_thread(_write_gzip_text, html_path, content),
+            asyncio.to_thread(info_path.write_text, json.dumps(info, indent=2)),
+        )
+        print(f"📄 HTML saved: {html_path} (unpack with: python -m gzip -d {html_path})")
         print(f"ℹ️  Info saved: {info_path}")
 
         print("\n" + "=" * 70)
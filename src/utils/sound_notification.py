@@ -6,6 +6,8 @@ Uses Windows winsound for reliable, built-in sound playback.
 """
 
 import logging
+import threading
+import time
 from typing import Optional
 
 
@@ -42,15 +44,38 @@ def play_success_sound(duration_ms: int = 500, frequency_hz: int = 1000) -> bool
         return False
 
 
-def play_custom_beep_pattern(pattern: list[tuple[int, int]]) -> bool:
+def _beep_pattern(winsound, pattern: list[tuple[int, int]], gap_ms: int) -> bool:
+    """Play the pattern synchronously (Beep blocks for each note)"""
+    try:
+        last = len(pattern) - 1
+        for i, (frequency, duration) in enumerate(pattern):
+            winsound.Beep(frequency, duration)
+            if gap_ms and i < last:
+                time.sleep(gap_ms / 1000)  # Small gap between beeps
+        return True
+    except Exception as e:
+        logging.warning(f"Failed to play custom beep pattern: {e}")
+        return False
+
+
+def play_custom_beep_pattern(
+    pattern: list[tuple[int, int]],
+    blocking: bool = False,
+    gap_ms: int = 50
+) -> bool:
     """
     Play a custom beep pattern.
 
+    By default the pattern plays on a daemon thread so the caller (e.g. the
+    booking workflow) keeps running while the sound plays.
+
     Args:
         pattern: List of (frequency_hz, duration_ms) tuples
+        blocking: If True, wait until the whole pattern has played
+        gap_ms: Pause between beeps in milliseconds (0 for none)
 
     Returns:
-        True if sound played successfully, False otherwise
+        True if sound played (or started playing) successfully, False otherwise
 
     Example:
         # Play ascending melody
@@ -62,26 +87,31 @@ def play_custom_beep_pattern(pattern: list[tuple[int, int]]) -> bool:
     """
     try:
         import winsound
-        import time
-
-        for frequency, duration in pattern:
-            winsound.Beep(frequency, duration)
-            time.sleep(0.05)  # Small gap between beeps
-        return True
     except ImportError:
         logging.warning("winsound not available (non-Windows platform)")
         return False
-    except Exception as e:
-        logging.warning(f"Failed to play custom beep pattern: {e}")
-        return False
+
+    if blocking:
+        return _beep_pattern(winsound, pattern, gap_ms)
+
+    threading.Thread(
+        target=_beep_pattern,
+        args=(winsound, pattern, gap_ms),
+        name="BeepPattern",
+        daemon=True
+    ).start()
+    return True
 
 
-def play_booking_success_alert() -> bool:
+def play_booking_success_alert(blocking: bool = False) -> bool:
     """
     Play a cheerful success alert for successful bookings.
 
     Plays an ascending 3-note melody that's pleasant and noticeable.
 
+    Args:
+        blocking: If True, wait until the melody has finished
+
     Returns:
         True if sound played successfully, False otherwise
     """
@@ -91,7 +121,7 @@ def play_booking_success_alert() -> bool:
         (800, 150),   # E5
         (1000, 300),  # C6 (hold longer)
     ]
-    return play_custom_beep_pattern(success_pattern)
+    return play_custom_beep_pattern(success_pattern, blocking=blocking)
 
 
 # Quick test function
@@ -101,8 +131,7 @@ if __name__ == "__main__":
     play_success_sound()
 
     print("\n2. Testing booking success alert...")
-    import time
     time.sleep(1)
-    play_booking_success_alert()
+    play_booking_success_alert(blocking=True)
 
     print("\nSound test complete!")
@@ -5,17 +5,68 @@ Validates users against whitelist in Supabase and logs usage.
 Transparent integration - users don't need to know about Supabase.
 """
 
+import atexit
+import functools
+import logging
+import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Tuple
 from config import Config
 
 
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that writes to whatever sys.stdout is at emit time (like print)"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass  # Always follow sys.stdout, even if it is redirected or wrapped later
+
+
+# Console output goes through one logger (one handler lock per message, lazy formatting).
+# Messages carry their own [LEVEL] tags, so the console looks the same as plain prints.
+logger = logging.getLogger("spaceiq.validator")
+if not logger.handlers:
+    _console_handler = _StdoutHandler()
+    _console_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_console_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Usage logging runs in the background so it never delays bot startup
+_log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="UsageLog")
+atexit.register(_log_executor.shutdown, wait=True)
+
+
+@functools.lru_cache(maxsize=1)
 def get_machine_id() -> str:
-    """Get unique machine identifier"""
+    """Get unique machine identifier (cached - it can't change while we run)"""
     return hex(uuid.getnode())
 
 
+@functools.lru_cache(maxsize=1)
+def _get_supabase_client():
+    """Create the Supabase client once so its connection pool is reused across calls"""
+    from supabase import create_client
+    return create_client(Config.SUPABASE_URL, Config.SUPABASE_ANON_KEY)
+
+
+def _do_log(log_data: dict):
+    """Insert a usage log row (runs on the background log executor)"""
+    try:
+        _get_supabase_client().table('usage_logs').insert(log_data).execute()
+        logger.info("[INFO] Usage logged to Supabase")
+
+    except Exception as log_error:
+        # Don't fail if logging fails - just warn
+        logger.warning("[WARNING] Could not log usage to Supabase: %s", log_error)
+
+
 def validate_user_and_log(username: str, skip_validation: bool = False) -> Tuple[bool, str]:
     """
     Validate user against Supabase whitelist and log usage.
@@ -36,32 +87,41 @@ def validate_user_and_log(username: str, skip_validation: bool = False) -> Tuple
         dev_mode = os.getenv("DEV_MODE", "false").lower() == "true"
 
         if not dev_mode:
-            print("[ERROR] --skip-validation requires DEV_MODE=true in .env file")
-            print("[ERROR] This flag is for development/testing only")
+            logger.error(
+                "[ERROR] --skip-validation requires DEV_MODE=true in .env file\n"
+                "[ERROR] This flag is for development/testing only"
+            )
             return (False, "Access denied - DEV_MODE not enabled")
 
-        print("[WARNING] DEV MODE: Validation skipped (--skip-validation flag)")
+        logger.warning("[WARNING] DEV MODE: Validation skipped (--skip-validation flag)")
         return (True, "")
 
     # Check if Supabase is configured
     if not Config.SUPABASE_URL or not Config.SUPABASE_ANON_KEY:
-        print("[WARNING] Supabase not configured - skipping validation")
-        print("[WARNING] Set SUPABASE_URL and SUPABASE_ANON_KEY in .env file")
+        logger.warning(
+            "[WARNING] Supabase not configured - skipping validation\n"
+            "[WARNING] Set SUPABASE_URL and SUPABASE_ANON_KEY in .env file"
+        )
         return (True, "")
 
     try:
-        from supabase import create_client, Client
-
-        # Initialize Supabase client
-        supabase: Client = create_client(Config.SUPABASE_URL, Config.SUPABASE_ANON_KEY)
+        # Get (cached) Supabase client
+        supabase = _get_supabase_client()
 
         # Check if user is in whitelist
-        print(f"[INFO] Validating user: {username}")
-
-        response = supabase.table('allowed_users').select('username, is_active').eq('username', username).execute()
-
-        # Check if user exists
-        if not response.data or len(response.data) == 0:
+        logger.info("[INFO] Validating user: %s", username)
+
+        response = (
+            supabase.table('allowed_users')
+            .select('is_active')
+            .eq('username', username)
+            .limit(1)
+            .maybe_single()
+            .execute()
+        )
+
+        # Check if user exists (some client versions return None instead of an empty response)
+        if response is None or response.data is None:
             # User not in whitelist
             error_msg = f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
@@ -78,10 +138,10 @@ Administrator: Add this user to the 'allowed_users' table in Supabase.
 
 ╔══════════════════════════════════════════════════════════════════════════════╗
 """
-            print(error_msg)
+            logger.error(error_msg)
             return (False, "Access denied - user not in whitelist")
 
-        user = response.data[0]
+        user = response.data
 
         # Check if user is active
         if not user.get('is_active', False):
@@ -96,43 +156,40 @@ To reactivate access, please contact the administrator.
 
 ╔══════════════════════════════════════════════════════════════════════════════╗
 """
-            print(error_msg)
+            logger.error(error_msg)
             return (False, "Access denied - account deactivated")
 
         # User is valid - log usage
-        print(f"[SUCCESS] User '{username}' validated successfully")
-
-        try:
-            # Log usage to Supabase
-            log_data = {
-                'username': username,
-                'machine_id': get_machine_id(),
-                'action': 'bot_startup',
-                'timestamp': datetime.utcnow().isoformat(),
-                'details': {
-                    'version': '1.0',
-                    'encrypted_auth': True
-                }
+        logger.info("[SUCCESS] User '%s' validated successfully", username)
+
+        # Log usage to Supabase (fire-and-forget)
+        log_data = {
+            'username': username,
+            'machine_id': get_machine_id(),
+            'action': 'bot_startup',
+            'timestamp': datetime.utcnow().isoformat(),
+            'details': {
+                'version': '1.0',
+                'encrypted_auth': True
             }
-
-            supabase.table('usage_logs').insert(log_data).execute()
-            print(f"[INFO] Usage logged to Supabase")
-
-        except Exception as log_error:
-            # Don't fail if logging fails - just warn
-            print(f"[WARNING] Could not log usage to Supabase: {log_error}")
+        }
+        _log_executor.submit(_do_log, log_data)
 
         return (True, "")
 
     except ImportError:
-        print("[WARNING] Supabase library not installed - skipping validation")
-        print("[WARNING] Run: pip install supabase")
+        logger.warning(
+            "[WARNING] Supabase library not installed - skipping validation\n"
+            "[WARNING] Run: pip install supabase"
+        )
         return (True, "")
 
     except Exception as e:
         # Don't fail on network errors - allow offline use
-        print(f"[WARNING] Supabase validation failed: {e}")
-        print("[WARNING] Continuing without validation (offline mode)")
+        logger.warning(
+            "[WARNING] Supabase validation failed: %s\n"
+            "[WARNING] Continuing without validation (offline mode)", e
+        )
         return (True, "")
 
 
@@ -164,15 +221,17 @@ def validate_user_from_auth_file(skip_validation: bool = False) -> Tuple[bool, s
         username_from_session = extract_username_from_session(session_data)
 
         if not username_from_session:
-            print("[WARNING] Could not extract username from session")
-            print("[WARNING] Skipping user validation")
+            logger.warning(
+                "[WARNING] Could not extract username from session\n"
+                "[WARNING] Skipping user validation"
+            )
             return (True, "")
 
         # Security check: Verify .auth_username matches session username
         # This prevents users from editing .auth_username to impersonate others
         username_file = Config.AUTH_STATE_FILE.parent / '.auth_username'
         if username_file.exists():
-            stored_username = open(username_file, 'r').read().strip()
+            stored_username = username_file.read_text(encoding='utf-8').strip()
             if stored_username != username_from_session:
                 error_msg = f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
@@ -190,14 +249,14 @@ This indicates file tampering. Please delete both files and re-run session warme
 
 ╔══════════════════════════════════════════════════════════════════════════════╗
 """
-                print(error_msg)
+                logger.error(error_msg)
                 return (False, "Security violation - username mismatch")
 
         # Validate against Supabase
         return validate_user_and_log(username_from_session, skip_validation)
 
     except Exception as e:
-        print(f"[ERROR] Failed to validate user: {e}")
+        logger.error("[ERROR] Failed to validate user: %s", e)
         return (False, f"Validation error: {e}")
 
 
@@ -210,20 +269,19 @@ def check_supabase_connection() -> bool:
     """
 
     if not Config.SUPABASE_URL or not Config.SUPABASE_ANON_KEY:
-        print("[ERROR] Supabase not configured")
+        logger.error("[ERROR] Supabase not configured")
         return False
 
     try:
-        from supabase import create_client
-
-        supabase = create_client(Config.SUPABASE_URL, Config.SUPABASE_ANON_KEY)
+        supabase = _get_supabase_client()
 
         # Try to query allowed_users table
-        response = supabase.table('allowed_users').select('count').execute()
+        # HEAD request: the row count comes back in Content-Range, no rows are transferred
+        response = supabase.table('allowed_users').select('*', count='exact', head=True).execute()
 
-        print(f"[SUCCESS] Supabase connection OK - {len(response.data)} users in whitelist")
+        logger.info("[SUCCESS] Supabase connection OK - %d users in whitelist", response.count)
         return True
 
     except Exception as e:
-        print(f"[ERROR] Supabase connection failed: {e}")
+        logger.error("[ERROR] Supabase connection failed: %s", e)
         return False
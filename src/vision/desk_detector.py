@@ -5,7 +5,7 @@ Computer Vision module to detect blue circles (available desks) on floor map scr
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 
 class DeskDetector:
@@ -14,16 +14,36 @@ class DeskDetector:
     def __init__(self):
         # Blue color range in HSV
         # Blue circles appear as a bright blue
-        self.lower_blue = np.array([90, 50, 50])    # Lower HSV bound
-        self.upper_blue = np.array([130, 255, 255]) # Upper HSV bound
-
-    def find_blue_circles(self, screenshot_path: str, debug: bool = False) -> List[Tuple[int, int]]:
+        # One 2x3 uint8 block (matches the HSV image, so inRange doesn't convert);
+        # lower/upper are contiguous row views into it
+        self._hsv_bounds = np.array([
+            [90, 50, 50],     # Lower HSV bound
+            [130, 255, 255],  # Upper HSV bound
+        ], dtype=np.uint8)
+        self.lower_blue = self._hsv_bounds[0]
+        self.upper_blue = self._hsv_bounds[1]
+
+        # HSV/mask buffers reused across screenshots of the same size
+        self._hsv_buf = None
+        self._mask_buf = None
+
+    def find_blue_circles(
+        self,
+        screenshot_path: str,
+        debug: bool = False,
+        scale: float = 0.5
+    ) -> List[Tuple[int, int]]:
         """
         Find all blue circles in a screenshot.
 
+        The color pass runs on a downscaled copy (cvtColor/inRange are memory
+        bound, so half size touches 4x fewer bytes); the dots stay several
+        pixels wide, and centers are mapped back to full-resolution coordinates.
+
         Args:
             screenshot_path: Path to screenshot image
             debug: If True, save debug images showing detection
+            scale: Downscale factor for detection (1.0 = full resolution)
 
         Returns:
             List of (x, y) coordinates for blue circle centers
@@ -36,34 +56,47 @@ class DeskDetector:
 
         # print(f"       Image size: {img.shape[1]}x{img.shape[0]}")
 
+        # Shrink before color conversion; INTER_AREA averages so small dots survive
+        small = img
+        if scale != 1.0:
+            small = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        # Floor map screenshots usually share one size, so reuse the buffers
+        if self._hsv_buf is None or self._hsv_buf.shape != small.shape:
+            self._hsv_buf = np.empty_like(small)
+            self._mask_buf = np.empty(small.shape[:2], dtype=np.uint8)
+
         # Convert to HSV color space
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV, dst=self._hsv_buf)
 
         # Create mask for blue color
-        mask = cv2.inRange(hsv, self.lower_blue, self.upper_blue)
+        mask = cv2.inRange(hsv, self.lower_blue, self.upper_blue, dst=self._mask_buf)
 
-        # Find contours
+        # Find the outline of each blue blob
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-        # print(f"       Found {len(contours)} blue regions")
-
-        # Extract circle centers
-        circles = []
+        # Filter by the area inside each outline (blue dots should be small but visible).
+        # Unlike a pixel count, this rejects thin lines, which enclose no area.
+        # Thresholds are in full-resolution pixels, so scale them with the image area.
+        area_scale = scale * scale
+        min_area, max_area = 10 * area_scale, 500 * area_scale  # Adjust these thresholds if needed
+        centroids = []
         for contour in contours:
-            # Get contour area
-            area = cv2.contourArea(contour)
-
-            # Filter by area (blue dots should be small but visible)
-            if 10 < area < 500:  # Adjust these thresholds if needed
-                # Get bounding box
+            if min_area < cv2.contourArea(contour) < max_area:
                 M = cv2.moments(contour)
                 if M["m00"] != 0:
-                    cx = int(M["m10"] / M["m00"])
-                    cy = int(M["m01"] / M["m00"])
-                    circles.append((cx, cy))
+                    centroids.append((M["m10"] / M["m00"], M["m01"] / M["m00"]))
 
-                    if debug:
-                        cv2.circle(img, (cx, cy), 5, (0, 255, 0), -1)
+        # Map pixel-center coordinates back to the full-resolution image
+        centroids = np.array(centroids, dtype=np.float64).reshape(-1, 2)
+        centers = np.floor((centroids + 0.5) / scale - 0.5).astype(np.int32)
+        circles = [tuple(center) for center in centers.tolist()]
+
+        # print(f"       Found {len(contours)} blue regions")
+
+        if debug:
+            for center in circles:
+                cv2.circle(img, center, 5, (0, 255, 0), -1)
 
         # print(f"       Detected {len(circles)} blue circles")
 
@@ -75,28 +108,55 @@ class DeskDetector:
 
         return circles
 
+    def find_blue_circles_batch(
+        self,
+        screenshot_paths: List[str],
+        scale: float = 0.5
+    ) -> List[List[Tuple[int, int]]]:
+        """
+        Find blue circles in several screenshots (e.g. one per floor).
+
+        Runs the screenshots back to back so same-sized images share the
+        HSV/mask buffers instead of allocating new ones per image.
+
+        Args:
+            screenshot_paths: Paths to screenshot images
+            scale: Downscale factor for detection (1.0 = full resolution)
+
+        Returns:
+            One list of (x, y) circle centers per screenshot, in input order
+        """
+        return [self.find_blue_circles(path, scale=scale) for path in screenshot_paths]
+
     def filter_circles_by_region(
         self,
-        circles: List[Tuple[int, int]],
+        circles: Union[List[Tuple[int, int]], np.ndarray],
         min_x: int = 0,
         max_x: int = 10000,
         min_y: int = 0,
-        max_y: int = 10000
-    ) -> List[Tuple[int, int]]:
+        max_y: int = 10000,
+        return_list: bool = True
+    ) -> Union[List[Tuple[int, int]], np.ndarray]:
         """
         Filter circles to specific region of the map.
 
         Args:
-            circles: List of (x, y) coordinates
+            circles: List of (x, y) coordinates or an (N, 2) array
             min_x, max_x, min_y, max_y: Region bounds
+            return_list: If False, return the filtered (N, 2) int32 array
+                         (skips the conversion back to tuples)
 
         Returns:
             Filtered list of coordinates
         """
-        return [
-            (x, y) for x, y in circles
-            if min_x <= x <= max_x and min_y <= y <= max_y
-        ]
+        arr = np.asarray(circles, dtype=np.int32).reshape(-1, 2)
+        x, y = arr[:, 0], arr[:, 1]
+        in_region = (x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y)
+        filtered = arr[in_region]
+
+        if not return_list:
+            return filtered
+        return [tuple(point) for point in filtered.tolist()]
 
 
 def test_detector(screenshot_path: str):
@@ -26,6 +26,19 @@ class DeskBookingWorkflow:
 
     def __init__(self):
         self.session_manager = SessionManager()
+        # True while used as "async with", so the browser stays warm between bookings
+        self._keep_session = False
+
+    async def __aenter__(self):
+        """Launch the browser once for a series of bookings"""
+        await self.session_manager.get_or_create_context()
+        self._keep_session = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared browser session"""
+        self._keep_session = False
+        await self.session_manager.close()
 
     async def book_desk(
         self,
@@ -50,6 +63,11 @@ class DeskBookingWorkflow:
                 location="San Francisco Office",
                 date="2025-10-30"
             )
+
+            # Several bookings on one warm browser
+            async with DeskBookingWorkflow() as workflow:
+                await workflow.book_desk("San Francisco Office", "2025-10-30")
+                await workflow.book_desk("San Francisco Office", "2025-10-31")
         """
 
         # Default to tomorrow if no date provided
@@ -66,9 +84,10 @@ class DeskBookingWorkflow:
             print(f"Preferences: {space_preferences}")
         print("=" * 70 + "\n")
 
+        page = None
         try:
-            # Initialize authenticated session
-            context = await self.session_manager.initialize()
+            # Reuse the warm authenticated context; only the page is per booking
+            context = await self.session_manager.get_or_create_context()
             page = await context.new_page()
 
             # Create page object
@@ -150,7 +169,11 @@ class DeskBookingWorkflow:
 
         finally:
             # Clean up
-            await self.session_manager.close()
+            if self._keep_session:
+                if page is not None:
+                    await page.close()
+            else:
+                await self.session_manager.close()
 
 
 async def quick_book_desk(location: str, date: Optional[str] = None) -> bool:
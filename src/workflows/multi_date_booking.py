@@ -7,20 +7,59 @@ Removes successfully booked dates from the config file.
 
 import asyncio
 import json
-from datetime import datetime, timedelta
+import os
+from datetime import date, datetime
 from pathlib import Path
 from typing import List, Dict, Any
 import logging
 
 from src.pages.spaceiq_booking_page import SpaceIQBookingPage
 from src.auth.session_manager import SessionManager
-from src.utils.file_logger import setup_file_logger
+from src.utils.file_logger import setup_file_logger, flush_file_logger
 from src.utils.console_logger import start_console_logging, stop_console_logging
 from src.utils.screenshot_cleanup import cleanup_old_screenshots
 from src.utils.log_cleanup import cleanup_old_logs
 from src.utils.rich_ui import ui, DateStatus
 from src.utils.sound_notification import play_booking_success_alert
 
+try:
+    import orjson  # Optional: faster C parser/serializer for the config file
+except ImportError:
+    orjson = None
+
+
+# Booking window: today through 4 weeks + 1 day ahead (29 days)
+BOOKING_WINDOW_DAYS = 29
+
+# Default number of dates probed at once (override with "max_concurrent_dates" in the config)
+MAX_CONCURRENT_DATES = 3
+
+
+def _upcoming_booking_dates(today: date, weekdays: List[int], window_days: int = BOOKING_WINDOW_DAYS) -> List[str]:
+    """
+    List the dates in the booking window that fall on the given weekdays.
+
+    Jumps straight to the first matching day for each weekday and steps a week
+    at a time, instead of checking every day in the window.
+
+    Args:
+        today: First day of the window
+        weekdays: Weekday numbers to book (Mon=0 ... Sun=6)
+        window_days: Days after today included in the window
+
+    Returns:
+        'YYYY-MM-DD' strings sorted from furthest to closest
+    """
+    start = today.toordinal()
+    end = start + window_days
+    ordinals = []
+    # Same test as the old "day.weekday() in weekdays" check, so out-of-range
+    # or non-integer entries match nothing
+    for weekday in (day for day in range(7) if day in weekdays):
+        ordinals.extend(range(start + (weekday - today.weekday()) % 7, end + 1, 7))
+    ordinals.sort(reverse=True)
+    return [date.fromordinal(o).isoformat() for o in ordinals]
+
 
 class MultiDateBookingWorkflow:
     """
@@ -37,6 +76,10 @@ class MultiDateBookingWorkflow:
 
     def __init__(self, refresh_interval: int = 30, max_attempts_per_date: int = 10, polling_mode: bool = False, headless: bool = False, continuous_loop: bool = False, skip_validation: bool = False):
         self.config_path = Path(__file__).parent.parent.parent / "config" / "booking_config.json"
+        # Parsed once for reads; refreshed from disk whenever booked dates are written
+        self._config = self.load_config()
+        # Dates to move to booked_dates on the next write
+        self._pending_booked: List[str] = []
         self.refresh_interval = refresh_interval
         self.max_attempts_per_date = max_attempts_per_date
         self.polling_mode = polling_mode
@@ -50,6 +93,10 @@ class MultiDateBookingWorkflow:
 
         self.continuous_loop = continuous_loop
         self.session_manager = SessionManager(headless=headless)
+        # Dates are probed concurrently, but only one tab at a time may pick and book a desk
+        self._booking_lock = asyncio.Lock()
+        # Idle date tabs, kept between dates to save opening a new page each time
+        self._date_tabs: List[SpaceIQBookingPage] = []
 
         # Setup file logging with size limits from config
         from config import Config
@@ -65,7 +112,7 @@ class MultiDateBookingWorkflow:
         self.console_log_file, self.console_logger = start_console_logging()
 
         # Cleanup old files (screenshots are large, logs are small and useful for debugging)
-        cleanup_old_screenshots(keep_sessions=2, logger=self.logger)
+        cleanup_old_screenshots(keep_sessions=2, logger=self.logger, async_mode=True)
         cleanup_old_logs(keep_sessions=10, logger=self.logger)
 
     def get_progressive_wait_time(self, round_num: int, config: Dict[str, Any] = None) -> int:
@@ -85,9 +132,9 @@ class MultiDateBookingWorkflow:
         Returns:
             Wait time in seconds
         """
-        # Load config if not provided
+        # Use the cached config if not provided
         if config is None:
-            config = self.load_config()
+            config = self._config
 
         # Get wait times from config with fallback defaults
         wait_times = config.get("wait_times", {})
@@ -110,30 +157,75 @@ class MultiDateBookingWorkflow:
 
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file."""
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
-
-    def save_config(self, config: Dict[str, Any]):
-        """Save configuration back to JSON file."""
-        with open(self.config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        # One read of the whole (small) file, then parse from memory
+        data = self.config_path.read_bytes()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def _write_config_sync(self, config: Dict[str, Any]):
+        """Write config to a temp file and swap it in, so readers never see a partial file."""
+        tmp_path = self.config_path.with_suffix(".tmp")
+        # Serialize in memory and write in one call (json.dump issues a write per token)
+        if orjson is not None:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2).encode('utf-8')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.config_path)
 
-    def remove_date_from_config(self, date_str: str):
-        """Move a successfully booked date to the booked_dates list."""
-        config = self.load_config()
-        if date_str in config.get("dates_to_try", []):
-            config["dates_to_try"].remove(date_str)
+    async def save_config(self, config: Dict[str, Any]):
+        """Save configuration back to JSON file (off the event loop)."""
+        await asyncio.to_thread(self._write_config_sync, config)
 
-            # Add to booked_dates history
-            if "booked_dates" not in config:
-                config["booked_dates"] = []
-            config["booked_dates"].append(date_str)
+    def _move_to_booked_sync(self, dates: List[str]):
+        """
+        Re-read the config file, move the given dates to booked_dates and write it back.
 
-            self.save_config(config)
-            msg = f"Moved {date_str} to booked_dates (successfully booked)"
+        Returns:
+            Tuple of (updated config, dates that were actually moved)
+        """
+        # Fresh read: the file may have been edited (e.g. from the web UI) while the bot runs
+        config = self.load_config()
+        moved = []
+        for date_str in dates:
+            if date_str in config.get("dates_to_try", []):
+                config["dates_to_try"].remove(date_str)
+
+                # Add to booked_dates history
+                if "booked_dates" not in config:
+                    config["booked_dates"] = []
+                config["booked_dates"].append(date_str)
+                moved.append(date_str)
+
+        if moved:
+            self._write_config_sync(config)
+        return config, moved
+
+    async def flush_config(self):
+        """Move the dates booked since the last write to booked_dates in the config file."""
+        if not self._pending_booked:
+            return
+
+        # Written once for the whole round; on failure the dates stay pending for the next flush
+        pending = list(self._pending_booked)
+        self._config, moved = await asyncio.to_thread(self._move_to_booked_sync, pending)
+        del self._pending_booked[:len(pending)]
+
+        if moved:
+            msg = f"Moved {', '.join(moved)} to booked_dates (successfully booked)"
             print(f"\n[INFO] {msg}")
             self.logger.info(msg)
 
+    def remove_date_from_config(self, date_str: str):
+        """
+        Move a successfully booked date to the booked_dates list.
+
+        Only records the date; flush_config() applies it to the file at the end of the round.
+        """
+        if date_str not in self._pending_booked:
+            self._pending_booked.append(date_str)
+
     async def run(self) -> Dict[str, bool]:
         """
         Execute multi-date booking workflow.
@@ -152,35 +244,24 @@ class MultiDateBookingWorkflow:
             print("\nBot startup cancelled due to validation failure.")
             return {}
 
-        # Load config
-        config = self.load_config()
+        # Config was loaded once in __init__
+        config = self._config
         building = config.get("building", "LC")
         floor = config.get("floor", "2")
         desk_prefix = config.get("desk_preferences", {}).get("prefix", "2.24")
+        priority_config = config.get("desk_preferences", {}).get("priority_ranges", [])
 
         # ALWAYS calculate dates fresh from calendar (ignore config dates)
         # This ensures we try every date, even if already marked as "booked"
         # Prevents false positives from removing dates prematurely
         today = datetime.now().date()
-        furthest_date = today + timedelta(weeks=4, days=1)  # 29 days
 
         # Get booking days from config (default to Wed=2, Thu=3)
         booking_days_config = config.get("booking_days", {})
         weekdays_to_book = booking_days_config.get("weekdays", [2, 3])
 
-        dates_to_try = []
-        current_date = today
-
-        while current_date <= furthest_date:
-            # Check if this weekday should be booked (from config)
-            if current_date.weekday() in weekdays_to_book:
-                # Only include dates that are not in the past
-                if current_date >= today:
-                    dates_to_try.append(current_date.strftime("%Y-%m-%d"))
-            current_date += timedelta(days=1)
-
-        # Sort from furthest to closest (most available first)
-        dates_to_try.sort(reverse=True)
+        # Sorted from furthest to closest (most available first)
+        dates_to_try = _upcoming_booking_dates(today, weekdays_to_book)
 
         if not dates_to_try:
             print("\n[WARNING] No Wed/Thu dates found in the next 29 days")
@@ -250,6 +331,17 @@ class MultiDateBookingWorkflow:
             round_num = 1
             # Read restart interval from config (default 50 rounds)
             restart_interval = config.get("browser_restart", {}).get("restart_every_n_rounds", 50)
+            # Dates are probed on separate tabs; cap how many run at once (SpaceIQ rate limits)
+            max_concurrent_dates = config.get("max_concurrent_dates", MAX_CONCURRENT_DATES)
+            try:
+                # 0 would block every date forever and a negative value fails in Semaphore
+                max_concurrent_dates = max(1, int(max_concurrent_dates))
+            except (TypeError, ValueError):
+                self.logger.warning(
+                    f"Invalid max_concurrent_dates {max_concurrent_dates!r} in config, using {MAX_CONCURRENT_DATES}"
+                )
+                max_concurrent_dates = MAX_CONCURRENT_DATES
+            date_slots = asyncio.Semaphore(max_concurrent_dates)
             while True:
                 ui.current_round = round_num
 
@@ -292,9 +384,9 @@ class MultiDateBookingWorkflow:
                         ui.set_operation("")
 
                         # Update dashboard with existing bookings
-                        for date in existing_bookings:
-                            if date in ui.date_statuses:
-                                ui.set_date_status(date, DateStatus.ALREADY_BOOKED)
+                        for booked_date in existing_bookings:
+                            if booked_date in ui.date_statuses:
+                                ui.set_date_status(booked_date, DateStatus.ALREADY_BOOKED)
 
                         self.logger.info(f"Found {len(existing_bookings)} existing bookings")
                     except Exception as e:
@@ -336,37 +428,29 @@ class MultiDateBookingWorkflow:
                 # ALWAYS recalculate dates from calendar (don't trust config)
                 # This ensures we verify every date every round
                 today_now = datetime.now().date()
-                furthest_date_now = today_now + timedelta(weeks=4, days=1)
+                today_str = today_now.isoformat()
 
                 dates_to_try_now = []
-                current_date_check = today_now
-
-                while current_date_check <= furthest_date_now:
-                    # Use weekdays_to_book from config (defined earlier in generate_dates_to_try)
-                    if current_date_check.weekday() in weekdays_to_book:
-                        if current_date_check >= today_now:
-                            date_str = current_date_check.strftime("%Y-%m-%d")
-                            # Skip if already booked
-                            if date_str not in existing_bookings:
-                                # Special check for today: only book if before cutoff time
-                                if current_date_check == today_now:
-                                    from config import Config
-                                    current_time = datetime.now()
-                                    cutoff_time = current_time.replace(
-                                        hour=Config.BOOKING_TODAY_CUTOFF_HOUR,
-                                        minute=Config.BOOKING_TODAY_CUTOFF_MINUTE,
-                                        second=0,
-                                        microsecond=0
-                                    )
-                                    if current_time >= cutoff_time:
-                                        # Too late to book today, skip it
-                                        self.logger.info(f"Skipping today ({date_str}) - after cutoff time {Config.BOOKING_TODAY_CUTOFF_HOUR:02d}:{Config.BOOKING_TODAY_CUTOFF_MINUTE:02d}")
-                                        current_date_check += timedelta(days=1)
-                                        continue
-                                dates_to_try_now.append(date_str)
-                    current_date_check += timedelta(days=1)
-
-                dates_to_try_now.sort(reverse=True)
+                # Use weekdays_to_book from config (already sorted furthest first)
+                for date_str in _upcoming_booking_dates(today_now, weekdays_to_book):
+                    # Skip if already booked
+                    if date_str in existing_bookings:
+                        continue
+                    # Special check for today: only book if before cutoff time
+                    if date_str == today_str:
+                        from config import Config
+                        current_time = datetime.now()
+                        cutoff_time = current_time.replace(
+                            hour=Config.BOOKING_TODAY_CUTOFF_HOUR,
+                            minute=Config.BOOKING_TODAY_CUTOFF_MINUTE,
+                            second=0,
+                            microsecond=0
+                        )
+                        if current_time >= cutoff_time:
+                            # Too late to book today, skip it
+                            self.logger.info(f"Skipping today ({date_str}) - after cutoff time {Config.BOOKING_TODAY_CUTOFF_HOUR:02d}:{Config.BOOKING_TODAY_CUTOFF_MINUTE:02d}")
+                            continue
+                    dates_to_try_now.append(date_str)
 
                 if not dates_to_try_now:
                     if existing_bookings:
@@ -388,28 +472,53 @@ class MultiDateBookingWorkflow:
 
                 round_results = {}
 
-                # Try each date once, move to next if no seats available
-                for idx, date_str in enumerate(dates_to_try_now, 1):
-                    # Mark as trying
-                    attempt_num = ui.date_attempts.get(date_str, 0) + 1
-                    ui.set_date_status(date_str, DateStatus.TRYING, attempt=attempt_num)
-                    ui.set_operation(f"Booking {date_str}", f"Date {idx}/{len(dates_to_try_now)} - Attempt #{attempt_num}")
-                    ui.log_activity(f"Starting booking for {date_str} (attempt {attempt_num})")
+                total_dates = len(dates_to_try_now)
 
-                    # Parse date
-                    target_date = datetime.strptime(date_str, '%Y-%m-%d')
-                    days_ahead = (target_date.date() - datetime.now().date()).days
+                async def probe_date(idx: int, date_str: str):
+                    """Try one date on its own tab (at most max_concurrent_dates at a time)."""
+                    async with date_slots:
+                        # Mark as trying
+                        attempt_num = ui.date_attempts.get(date_str, 0) + 1
+                        ui.set_date_status(date_str, DateStatus.TRYING, attempt=attempt_num)
+                        ui.set_operation(f"Booking {date_str}", f"Date {idx}/{total_dates} - Attempt #{attempt_num}")
+                        ui.log_activity(f"Starting booking for {date_str} (attempt {attempt_num})")
 
-                    # Try booking this date (single attempt to check availability)
-                    success, desk_code = await self._try_booking_date(
-                        booking_page=booking_page,
-                        page=page,
-                        date_str=date_str,
-                        days_ahead=days_ahead,
-                        building=building,
-                        floor=floor,
-                        desk_prefix=desk_prefix
-                    )
+                        # Parse date (fromisoformat is a C fast path; strings are YYYY-MM-DD)
+                        days_ahead = (date.fromisoformat(date_str) - datetime.now().date()).days
+
+                        date_tab = None
+                        finished = False
+                        success, desk_code = False, None
+                        try:
+                            date_tab = await self._acquire_date_tab(context)
+
+                            # Try booking this date (single attempt to check availability)
+                            success, desk_code = await self._try_booking_date(
+                                booking_page=date_tab,
+                                page=date_tab.page,
+                                date_str=date_str,
+                                days_ahead=days_ahead,
+                                building=building,
+                                floor=floor,
+                                desk_prefix=desk_prefix,
+                                priority_config=priority_config
+                            )
+                            finished = True
+                        except Exception as e:
+                            if date_tab is None:
+                                self.logger.error(f"Could not open a tab for {date_str}: {e}")
+                            else:
+                                self.logger.error(f"Error trying {date_str}: {e}")
+                        finally:
+                            if finished:
+                                # Back to the pool for the next date
+                                self._date_tabs.append(date_tab)
+                            elif date_tab is not None:
+                                # Failed or cancelled mid-way - don't leave the tab open
+                                try:
+                                    await date_tab.page.close()
+                                except Exception:
+                                    pass
 
                     round_results[date_str] = success
                     results[date_str] = success
@@ -427,6 +536,17 @@ class MultiDateBookingWorkflow:
                         ui.log_activity(f"SKIPPED: {date_str} - No available desks")
                         self.logger.info(f"No available desks for {date_str}")
 
+                # Try each date once (several tabs in parallel), move on if no seats available
+                await asyncio.gather(*(
+                    probe_date(idx, date_str)
+                    for idx, date_str in enumerate(dates_to_try_now, 1)
+                ))
+
+                # One config write per round, however many dates were booked
+                await self.flush_config()
+                # Round boundary: write the buffered log records
+                flush_file_logger(self.logger)
+
                 # Check if we should continue polling
                 any_booked = any(round_results.values())
 
@@ -489,11 +609,26 @@ class MultiDateBookingWorkflow:
 
         finally:
             ui.stop_live_dashboard()
+            # Don't lose bookings recorded in a round that was cut short
+            try:
+                await self.flush_config()
+            except Exception as e:
+                self.logger.error(f"Failed to save config: {e}")
+            flush_file_logger(self.logger)
             await self.session_manager.close()
 
             # Stop console logging
             stop_console_logging(self.console_logger)
 
+    async def _acquire_date_tab(self, context) -> SpaceIQBookingPage:
+        """Reuse an idle date tab or open a new one."""
+        while self._date_tabs:
+            date_tab = self._date_tabs.pop()
+            # Tabs from before a browser restart are closed along with their context
+            if not date_tab.page.is_closed():
+                return date_tab
+        return SpaceIQBookingPage(await context.new_page())
+
     async def _try_booking_date(
         self,
         booking_page: SpaceIQBookingPage,
@@ -502,7 +637,8 @@ class MultiDateBookingWorkflow:
         days_ahead: int,
         building: str,
         floor: str,
-        desk_prefix: str
+        desk_prefix: str,
+        priority_config: List[Dict[str, Any]] = None
     ) -> tuple[bool, str]:
         """
         Try booking a specific date.
@@ -519,6 +655,8 @@ class MultiDateBookingWorkflow:
         try:
             # Steps 1-6: Navigation (consolidated into single progress line)
             ui.log_activity(f"  Loading floor map for {date_str}...")
+            # Always reload the floor view: on a reused tab the previous date's map and
+            # sidebar are still on screen and could be read as this date's availability
             await booking_page.navigate_to_floor_view(building, floor)
             await booking_page.click_book_desk_button()
             await booking_page.open_date_picker()
@@ -533,10 +671,12 @@ class MultiDateBookingWorkflow:
                 else:
                     raise  # Re-raise if it's a different error
 
+            map_baseline = await booking_page.count_map_elements()
             await booking_page.click_update_button()
             await booking_page.wait_for_floor_map_to_load()
             ui.log_activity(f"  Waiting for SVG to render...")
-            await asyncio.sleep(7)  # Wait for SVG to render
+            await booking_page.wait_for_map_to_render(map_baseline)  # Returns once the new date's SVG settles
+            await asyncio.sleep(0.5)  # Small guard for late paints
 
             # Step 7: Check available desks
             ui.log_activity(f"  Checking available {desk_prefix}.* desks...")
@@ -553,10 +693,7 @@ class MultiDateBookingWorkflow:
             ui.log_activity(f"  Found {len(available_desks)} desk(s)")
             self.logger.info(f"Available desks: {len(available_desks)}")
 
-            # Sort by priority (if configured)
-            config = self.load_config()
-            priority_config = config.get("desk_preferences", {}).get("priority_ranges", [])
-
+            # Sort by priority (if configured; read once per run)
             if priority_config:
                 from src.utils.desk_priority import sort_desks_by_priority
 
@@ -564,24 +701,26 @@ class MultiDateBookingWorkflow:
                 self.logger.info(f"Desks sorted by priority")
                 available_desks = sorted_desks
 
-            # Step 8: Use CV to find and click desk
-            ui.log_activity(f"  Using CV to find desk on map...")
-            found_desk = await booking_page.find_and_click_available_desks(
-                available_desks=available_desks,
-                logger=self.logger
-            )
-
-            if not found_desk:
-                ui.log_activity(f"  ERROR: Could not locate desk on map")
-                self.logger.error(f"Could not locate desk on map for {date_str}")
-                return False, None
+            # Steps 8-9 share the CV screenshot and desk positions with other tabs - one at a time
+            async with self._booking_lock:
+                # Step 8: Use CV to find and click desk
+                ui.log_activity(f"  Using CV to find desk on map...")
+                found_desk = await booking_page.find_and_click_available_desks(
+                    available_desks=available_desks,
+                    logger=self.logger
+                )
+
+                if not found_desk:
+                    ui.log_activity(f"  ERROR: Could not locate desk on map")
+                    self.logger.error(f"Could not locate desk on map for {date_str}")
+                    return False, None
 
-            ui.log_activity(f"  Clicked desk {found_desk}, submitting booking...")
+                ui.log_activity(f"  Clicked desk {found_desk}, submitting booking...")
 
-            # Step 9: Book the desk
-            await booking_page.click_book_now_in_popup()
-            await asyncio.sleep(2)
-            success = await booking_page.verify_booking_success()
+                # Step 9: Book the desk
+                await booking_page.click_book_now_in_popup()
+                await asyncio.sleep(2)
+                success = await booking_page.verify_booking_success()
 
             if success:
                 ui.log_activity(f"  Booking verified successfully!")
@@ -819,20 +958,9 @@ async def run_multi_date_booking_web_mode(
     weekdays_to_book = booking_days_config.get("weekdays", [2, 3])  # Wed=2, Thu=3
 
 
-    # Calculate dates from calendar
+    # Calculate dates from calendar (furthest first)
     today = datetime.now().date()
-    furthest_date = today + timedelta(weeks=4, days=1)  # 29 days
-
-    dates_to_try = []
-    current_date = today
-
-    while current_date <= furthest_date:
-        if current_date.weekday() in weekdays_to_book:
-            if current_date >= today:
-                dates_to_try.append(current_date.strftime("%Y-%m-%d"))
-        current_date += timedelta(days=1)
-
-    dates_to_try.sort(reverse=True)
+    dates_to_try = _upcoming_booking_dates(today, weekdays_to_book)
 
     if not dates_to_try:
         web_logger.warning("No eligible dates found in the next 29 days")
@@ -923,7 +1051,7 @@ async def run_multi_date_booking_web_mode(
             dates_to_try_now = []
             for date_str in config.get("dates_to_try", []):
                 try:
-                    date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
+                    date_obj = date.fromisoformat(date_str)
 
                     # Skip if date is in the past
                     if date_obj < today_now:
@@ -969,8 +1097,7 @@ async def run_multi_date_booking_web_mode(
                 web_logger.info(f"Attempting booking for {date_str} ({idx}/{len(dates_to_try_now)})")
 
                 try:
-                    target_date = datetime.strptime(date_str, '%Y-%m-%d')
-                    days_ahead = (target_date.date() - datetime.now().date()).days
+                    days_ahead = (date.fromisoformat(date_str) - datetime.now().date()).days
 
                     success, desk_code = await _try_booking_date_web_mode(
                         booking_page=booking_page,
@@ -1077,9 +1204,11 @@ async def _try_booking_date_web_mode(
             else:
                 raise
 
+        map_baseline = await booking_page.count_map_elements()
         await booking_page.click_update_button()
         await booking_page.wait_for_floor_map_to_load()
-        await asyncio.sleep(7)  # Wait for SVG to render
+        await booking_page.wait_for_map_to_render(map_baseline)  # Returns once the new date's SVG settles
+        await asyncio.sleep(0.5)  # Small guard for late paints
 
         # Capture screenshot for CV detection (silent)
         await booking_page.capture_screenshot("floor_map_loaded")
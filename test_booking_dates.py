@@ -0,0 +1,48 @@
+"""
+Test booking date calculation against the original day-by-day loop
+
+Covers every start weekday and the weekday lists a hand-edited
+booking_config.json may contain (including invalid entries):
+    python test_booking_dates.py
+"""
+
+from datetime import date, timedelta
+
+from src.workflows.multi_date_booking import BOOKING_WINDOW_DAYS, _upcoming_booking_dates
+
+WEEKDAY_LISTS = [
+    [2, 3],
+    [0, 1, 2, 3, 4, 5, 6],
+    [],
+    [4, 4],
+    [7, -1, 3],
+    ["2", 3],
+    [2.0, True],
+]
+
+
+def _old_booking_dates(today: date, weekdays) -> list:
+    """The loop _upcoming_booking_dates replaced: check every day in the window"""
+    furthest_date = today + timedelta(days=BOOKING_WINDOW_DAYS)
+    dates_to_try = []
+    current_date = today
+    while current_date <= furthest_date:
+        if current_date.weekday() in weekdays:
+            dates_to_try.append(current_date.strftime("%Y-%m-%d"))
+        current_date += timedelta(days=1)
+    dates_to_try.sort(reverse=True)
+    return dates_to_try
+
+
+def test_matches_old_loop():
+    """Same dates for every start weekday, including invalid weekday entries"""
+    for offset in range(7):
+        today = date(2025, 10, 27) + timedelta(days=offset)
+        for weekdays in WEEKDAY_LISTS:
+            expected = _old_booking_dates(today, weekdays)
+            assert _upcoming_booking_dates(today, weekdays) == expected, (today, weekdays)
+
+
+if __name__ == "__main__":
+    test_matches_old_loop()
+    print("[OK] test_matches_old_loop")
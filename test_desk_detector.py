@@ -0,0 +1,60 @@
+"""
+Test blue circle detection on synthetic floor maps
+
+Checks that solid blue dots are found and that thin blue lines and hollow
+outlines (walls, room borders) are not mistaken for desks:
+    python test_desk_detector.py
+"""
+
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from src.vision.desk_detector import DeskDetector
+
+BLUE = (255, 120, 30)  # BGR, inside the detector's HSV range
+BACKGROUND = (240, 240, 240)
+
+
+def _save_map(img: np.ndarray, directory: str, name: str) -> str:
+    path = str(Path(directory) / name)
+    cv2.imwrite(path, img)
+    return path
+
+
+def test_finds_solid_dots():
+    """Every isolated solid dot is reported once, near its center"""
+    img = np.full((600, 800, 3), BACKGROUND, np.uint8)
+    dots = [(100 + i * 60, 100 + (i % 4) * 80) for i in range(10)]
+    for x, y in dots:
+        cv2.circle(img, (x, y), 6, BLUE, -1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _save_map(img, tmp, "dots.png")
+        for scale in (0.5, 1.0):
+            circles = DeskDetector().find_blue_circles(path, scale=scale)
+            assert len(circles) == len(dots), (scale, circles)
+            for x, y in dots:
+                assert any(abs(x - cx) <= 1 and abs(y - cy) <= 1 for cx, cy in circles), (scale, x, y)
+
+
+def test_rejects_lines_and_outlines():
+    """Thin lines and large hollow outlines enclose no desk-sized area"""
+    img = np.full((800, 800, 3), BACKGROUND, np.uint8)
+    for i in range(10):
+        cv2.line(img, (20, 20 + i * 30), (300, 20 + i * 30), BLUE, 1)
+        cv2.line(img, (20 + i * 25, 400), (20 + i * 25, 700), BLUE, 2)
+        cv2.rectangle(img, (400, 20 + i * 70), (460, 80 + i * 70), BLUE, 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _save_map(img, tmp, "lines.png")
+        for scale in (0.5, 1.0):
+            assert DeskDetector().find_blue_circles(path, scale=scale) == [], scale
+
+
+if __name__ == "__main__":
+    for test in (test_finds_solid_dots, test_rejects_lines_and_outlines):
+        test()
+        print(f"[OK] {test.__name__}")